@@ -3,6 +3,7 @@ import time
 import os
 import numpy as np
 from datetime import datetime
+from src.processing.disk_writer import DiskWriter
 from src.processing.image_capture import ImageCapture
 from src.processing.pattern_matcher import ReadingType
 
@@ -17,7 +18,10 @@ def main():
     print(f"Captures will be saved to: {captures_dir}")
     print("Press 'q' to quit, 'c' to capture and process")
     
-    with ImageCapture() as capture:
+    # Side-by-side (original | preprocessed) canvas, reused across captures
+    display = None
+    
+    with ImageCapture() as capture, DiskWriter() as writer:
         while True:
             # Just capture frame without processing
             frame = capture.capture_frame()
@@ -39,8 +43,15 @@ def main():
                 text, confidence, readings = capture.process_frame(frame)
                 
                 # Show both original and preprocessed images
-                preprocessed_display = cv2.cvtColor(preprocessed, cv2.COLOR_GRAY2BGR)
-                display = np.hstack((frame, preprocessed_display))
+                h, w = frame.shape[:2]
+                if display is None or display.shape[:2] != (h, 2 * w):
+                    display = np.empty((h, 2 * w, 3), dtype=np.uint8)
+                display[:, :w] = frame
+                # Preprocessing may run on a downscaled copy; scale it back up for display
+                preview = preprocessed
+                if preview.shape[:2] != (h, w):
+                    preview = cv2.resize(preview, (w, h), interpolation=cv2.INTER_NEAREST)
+                cv2.cvtColor(np.ascontiguousarray(preview), cv2.COLOR_GRAY2BGR, dst=display[:, w:])
                 cv2.imshow('Capture Results (Original | Preprocessed)', display)
                 cv2.waitKey(1000)  # Show for 1 second
                 
@@ -48,10 +59,10 @@ def main():
                 timestamp = time.strftime("%Y%m%d-%H%M%S")
                 image_path = os.path.join(captures_dir, f"capture_{timestamp}.jpg")
                 preprocessed_path = os.path.join(captures_dir, f"preprocessed_{timestamp}.jpg")
-                cv2.imwrite(image_path, frame)
-                cv2.imwrite(preprocessed_path, preprocessed)
-                print(f"\nSaved capture to {image_path}")
-                print(f"Saved preprocessed image to {preprocessed_path}")
+                writer.submit(image_path, frame)
+                writer.submit(preprocessed_path, preprocessed)
+                print(f"\nSaving capture to {image_path}")
+                print(f"Saving preprocessed image to {preprocessed_path}")
                 
                 # Display results
                 print(f"\nExtracted Text: {text}")
@@ -69,16 +80,18 @@ def main():
                 # Save the readings to a text file
                 if readings:
                     readings_path = os.path.join(captures_dir, f"readings_{timestamp}.txt")
-                    with open(readings_path, 'w') as f:
-                        f.write(f"Timestamp: {timestamp}\n")
-                        f.write(f"Extracted Text: {text}\n")
-                        f.write(f"Confidence: {confidence:.2f}%\n\n")
-                        f.write("Detected Readings:\n")
-                        for reading in readings:
-                            f.write(f"- {reading.type.value}: {reading.value} {reading.unit}\n")
-                            if not reading.is_valid:
-                                f.write(f"  (Invalid reading - outside normal range)\n")
-                    print(f"Saved readings to {readings_path}")
+                    lines = [
+                        f"Timestamp: {timestamp}\n",
+                        f"Extracted Text: {text}\n",
+                        f"Confidence: {confidence:.2f}%\n\n",
+                        "Detected Readings:\n",
+                    ]
+                    for reading in readings:
+                        lines.append(f"- {reading.type.value}: {reading.value} {reading.unit}\n")
+                        if not reading.is_valid:
+                            lines.append(f"  (Invalid reading - outside normal range)\n")
+                    writer.submit(readings_path, "".join(lines).encode())
+                    print(f"Saving readings to {readings_path}")
     
     print("\nCapture session ended")
 
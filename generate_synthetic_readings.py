@@ -1,22 +1,29 @@
+import functools
 import os
 import cv2
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
-def generate_reading_image(text, font_path, font_size, img_size=(400, 200), bg_color=(255, 255, 255), text_color=(0, 0, 0)):
-    """Generates an image with the given text."""
-    img = Image.new('RGB', img_size, color=bg_color)
-    d = ImageDraw.Draw(img)
+@functools.lru_cache(maxsize=8)
+def load_font(font_path, font_size):
+    """Loads a TrueType font once per (path, size), falling back to system or default fonts."""
     try:
-        font = ImageFont.truetype(font_path, font_size)
+        return ImageFont.truetype(font_path, font_size)
     except IOError:
         # Fallback to a more robust font path for macOS or default
         try:
             font = ImageFont.truetype("/System/Library/Fonts/Supplemental/Arial.ttf", font_size)
             print("Using system Arial font.")
+            return font
         except IOError:
-            font = ImageFont.load_default()
             print(f"Warning: Could not load font. Using default font.")
+            return ImageFont.load_default()
+
+def generate_reading_image(text, font_path, font_size, img_size=(400, 200), bg_color=(255, 255, 255), text_color=(0, 0, 0)):
+    """Generates an image with the given text."""
+    img = Image.new('RGB', img_size, color=bg_color)
+    d = ImageDraw.Draw(img)
+    font = load_font(font_path, font_size)
 
     bbox = d.textbbox((0, 0), text, font=font)
     text_width = bbox[2] - bbox[0]
@@ -6,8 +6,13 @@ from enum import Enum
 import logging
 from pathlib import Path
 import csv
+import functools
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 
-from .pattern_matcher import MedicalReading, ReadingType
+from .pattern_matcher import MedicalReading, ReadingType, ReadingsBatch
 from .number_extractor import ExtractedNumber
 
 # Configure logging
@@ -17,6 +22,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Position of each reading type in the per-batch type histogram
+_TYPE_INDEX = {rt: i for i, rt in enumerate(ReadingType)}
+
+# Buffer size for result files, so large exports are written in few syscalls
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Per-process counter used to make output file names unique
+_file_ids = itertools.count(1)
+
+# Batches smaller than this are processed in-process; pool startup would dominate
+_PARALLEL_MIN_BATCH = 64
+
 class ProcessingStatus(Enum):
     """Status of image processing."""
     SUCCESS = "success"
@@ -54,11 +71,28 @@ class DataProcessor:
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Filenames share one session timestamp plus a counter instead of
+        # formatting the clock per file (which also collided within a second)
+        self._session_ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+    
+    def _next_file_stem(self, prefix: str) -> str:
+        """Return a unique file stem for this processor.
+        
+        The counter is per process, and the process id is included so batch
+        workers writing into the same directory never produce the same name.
+        
+        Args:
+            prefix: Leading part of the file name, e.g. 'result'
+            
+        Returns:
+            File stem without extension
+        """
+        return f'{prefix}_{self._session_ts}_{os.getpid()}_{next(_file_ids):06d}'
     
     def process_single_image(
         self,
         image_path: str,
-        readings: List[MedicalReading],
+        readings: Union[List[MedicalReading], ReadingsBatch],
         confidence: float,
         metadata: Optional[Dict[str, Any]] = None
     ) -> ProcessingResult:
@@ -66,13 +100,19 @@ class DataProcessor:
         
         Args:
             image_path: Path to the processed image
-            readings: List of medical readings extracted from the image
+            readings: Medical readings extracted from the image, as a list or ReadingsBatch
             confidence: Confidence score of the OCR process
             metadata: Additional metadata about the image/device
             
         Returns:
             ProcessingResult containing the processing status and results
         """
+        if isinstance(readings, ReadingsBatch):
+            valid_count = int(readings.is_valid.sum())
+            readings = readings.to_readings()
+        else:
+            valid_count = None
+        
         if not readings:
             return ProcessingResult(
                 image_path=image_path,
@@ -85,18 +125,21 @@ class DataProcessor:
             )
         
         # Count valid readings
-        valid_readings = [r for r in readings if r.is_valid]
+        if valid_count is None:
+            valid_count = 0
+            for r in readings:
+                valid_count += r.is_valid
         
         # Determine status
-        if len(valid_readings) == len(readings):
+        if valid_count == len(readings):
             status = ProcessingStatus.SUCCESS
             error_message = None
-        elif len(valid_readings) == 0:
+        elif valid_count == 0:
             status = ProcessingStatus.FAILED
             error_message = "No valid readings found"
         else:
             status = ProcessingStatus.PARTIAL
-            error_message = f"Only {len(valid_readings)} of {len(readings)} readings are valid"
+            error_message = f"Only {valid_count} of {len(readings)} readings are valid"
         
         result = ProcessingResult(
             image_path=image_path,
@@ -115,34 +158,38 @@ class DataProcessor:
     
     def process_batch(
         self,
-        image_results: List[Dict[str, Any]]
+        image_results: List[Dict[str, Any]],
+        max_workers: Optional[int] = None
     ) -> BatchResult:
         """Process a batch of image results.
         
+        Large batches are spread over a process pool; each worker processes
+        and saves its images independently and the summary is reduced here.
+        
         Args:
             image_results: List of dictionaries containing image processing results
+            max_workers: Number of worker processes (defaults to the CPU count);
+                1 processes the batch in the calling process
             
         Returns:
             BatchResult containing summary statistics and individual results
         """
-        results = []
         successful_images = 0
         failed_images = 0
         total_readings = 0
         valid_readings = 0
         total_confidence = 0.0
-        reading_type_counts = {rt.name: 0 for rt in ReadingType}
-        
-        for img_result in image_results:
-            result = self.process_single_image(
-                image_path=img_result['image_path'],
-                readings=img_result['readings'],
-                confidence=img_result['confidence'],
-                metadata=img_result.get('metadata')
-            )
-            
-            results.append(result)
-            
+        valid_type_indices = []
+        
+        workers = max_workers or os.cpu_count() or 1
+        process_one = functools.partial(_process_image_result, self)
+        if workers > 1 and len(image_results) >= _PARALLEL_MIN_BATCH:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(process_one, image_results, chunksize=16))
+        else:
+            results = [process_one(img_result) for img_result in image_results]
+        
+        for result in results:
             # Update statistics
             if result.status == ProcessingStatus.SUCCESS:
                 successful_images += 1
@@ -150,20 +197,23 @@ class DataProcessor:
                 failed_images += 1
             
             total_readings += len(result.readings)
-            valid_readings += sum(1 for r in result.readings if r.is_valid)
             total_confidence += result.confidence
             
-            # Count reading types
-            for reading in result.readings:
-                if reading.is_valid:
-                    reading_type_counts[reading.type.name] += 1
+            # Count valid readings and their types in one pass
+            valid_types = [_TYPE_INDEX[reading.type] for reading in result.readings if reading.is_valid]
+            valid_readings += len(valid_types)
+            valid_type_indices.extend(valid_types)
+        
+        reading_type_counts = np.bincount(
+            np.asarray(valid_type_indices, dtype=np.int64), minlength=len(_TYPE_INDEX)
+        ).tolist()
         
         # Calculate summary
         summary = {
             'total_readings': total_readings,
             'valid_readings': valid_readings,
             'average_confidence': total_confidence / len(image_results) if image_results else 0.0,
-            'reading_types': reading_type_counts
+            'reading_types': {rt.name: reading_type_counts[i] for rt, i in _TYPE_INDEX.items()}
         }
         
         batch_result = BatchResult(
@@ -188,10 +238,9 @@ class DataProcessor:
         Returns:
             Path to the created CSV file
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        csv_path = self.output_dir / f'results_{timestamp}.csv'
+        csv_path = self.output_dir / f"{self._next_file_stem('results')}.csv"
         
-        with open(csv_path, 'w', newline='') as f:
+        with open(csv_path, 'w', newline='', buffering=_WRITE_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             
             # Write header
@@ -207,18 +256,20 @@ class DataProcessor:
             ])
             
             # Write data rows
-            for result in batch_result.results:
-                for reading in result.readings:
-                    writer.writerow([
-                        result.image_path,
-                        result.timestamp,
-                        result.status.value,
-                        reading.type.name,
-                        reading.value,
-                        reading.unit,
-                        reading.is_valid,
-                        result.confidence
-                    ])
+            writer.writerows(
+                (
+                    result.image_path,
+                    result.timestamp,
+                    result.status.value,
+                    reading.type.name,
+                    reading.value,
+                    reading.unit,
+                    reading.is_valid,
+                    result.confidence
+                )
+                for result in batch_result.results
+                for reading in result.readings
+            )
         
         return str(csv_path)
     
@@ -228,10 +279,21 @@ class DataProcessor:
         Args:
             result: ProcessingResult to save
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f'result_{timestamp}.json'
+        filename = f"{self._next_file_stem('result')}.json"
         
-        data = {
+        self._write_json(self.output_dir / filename, self._result_to_dict(result))
+    
+    @staticmethod
+    def _result_to_dict(result: ProcessingResult) -> Dict[str, Any]:
+        """Convert a processing result to its JSON-serializable form.
+        
+        Args:
+            result: ProcessingResult to convert
+            
+        Returns:
+            Dictionary representation of the result
+        """
+        return {
             'image_path': result.image_path,
             'timestamp': result.timestamp,
             'status': result.status.value,
@@ -248,45 +310,65 @@ class DataProcessor:
             'error_message': result.error_message,
             'metadata': result.metadata
         }
+    
+    @staticmethod
+    def _write_json(path: Path, data: Dict[str, Any]) -> None:
+        """Write data as compact JSON.
+        
+        json.dumps without indentation runs on the C encoder; json.dump and
+        indented output both fall back to the pure-Python encoder.
         
-        with open(self.output_dir / filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        Args:
+            path: Destination file path
+            data: JSON-serializable data to write
+        """
+        with open(path, 'w', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(json.dumps(data, separators=(',', ':')))
     
     def _save_batch_result(self, batch_result: BatchResult) -> None:
         """Save a batch result to JSON.
         
+        Results are serialized and written one at a time rather than first
+        building a single nested structure for the whole batch, so peak memory
+        stays flat for large batches.
+        
         Args:
             batch_result: BatchResult to save
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f'batch_result_{timestamp}.json'
+        filename = f"{self._next_file_stem('batch_result')}.json"
         
-        data = {
+        header = {
             'total_images': batch_result.total_images,
             'successful_images': batch_result.successful_images,
             'failed_images': batch_result.failed_images,
-            'summary': batch_result.summary,
-            'results': [
-                {
-                    'image_path': r.image_path,
-                    'timestamp': r.timestamp,
-                    'status': r.status.value,
-                    'readings': [
-                        {
-                            'type': reading.type.name,
-                            'value': reading.value,
-                            'unit': reading.unit,
-                            'is_valid': reading.is_valid
-                        }
-                        for reading in r.readings
-                    ],
-                    'confidence': r.confidence,
-                    'error_message': r.error_message,
-                    'metadata': r.metadata
-                }
-                for r in batch_result.results
-            ]
+            'summary': batch_result.summary
         }
+        separators = (',', ':')
+        
+        with open(self.output_dir / filename, 'w', buffering=_WRITE_BUFFER_SIZE) as f:
+            # Reopen the header object and append the results array to it
+            f.write(json.dumps(header, separators=separators)[:-1])
+            f.write(',"results":[')
+            for i, result in enumerate(batch_result.results):
+                if i:
+                    f.write(',')
+                f.write(json.dumps(self._result_to_dict(result), separators=separators))
+            f.write(']}')
+
+
+def _process_image_result(processor: DataProcessor, img_result: Dict[str, Any]) -> ProcessingResult:
+    """Process one entry of a batch; module-level so it can run in a worker process.
+    
+    Args:
+        processor: DataProcessor whose output directory receives the result
+        img_result: Dictionary containing one image's processing results
         
-        with open(self.output_dir / filename, 'w') as f:
-            json.dump(data, f, indent=2) 
\ No newline at end of file
+    Returns:
+        ProcessingResult for the image
+    """
+    return processor.process_single_image(
+        image_path=img_result['image_path'],
+        readings=img_result['readings'],
+        confidence=img_result['confidence'],
+        metadata=img_result.get('metadata')
+    )
@@ -0,0 +1,83 @@
+import os
+import queue
+import threading
+from typing import Optional, Union
+
+import cv2
+import numpy as np
+
+class DiskWriter:
+    """Writes images and files to disk on a background thread."""
+
+    _STOP = object()
+    _JPEG_EXTENSIONS = ('.jpg', '.jpeg')
+
+    def __init__(self, max_pending: int = 8, jpeg_quality: int = 90):
+        """
+        Initialize the disk writer.
+
+        Args:
+            max_pending: Maximum number of queued writes before submit blocks
+            jpeg_quality: JPEG quality (0-100) used for .jpg/.jpeg paths
+        """
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._jpeg_params = [cv2.IMWRITE_JPEG_QUALITY, jpeg_quality]
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the background writer thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def submit(self, path: str, data: Union[np.ndarray, bytes]) -> None:
+        """
+        Queue a write.
+
+        Images are encoded on the writer thread using the format implied by
+        the path's extension, so the caller must not modify the array after
+        submitting it (pass a copy if the buffer is reused).
+
+        Args:
+            path: Destination file path
+            data: Image array to encode, or raw bytes to write
+        """
+        self.start()
+        self._queue.put((path, data))
+
+    def close(self) -> None:
+        """Wait for all queued writes to finish and stop the writer thread."""
+        if self._thread is not None:
+            self._queue.put(self._STOP)
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        """Process queued writes until the stop sentinel is received."""
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                break
+            path, data = item
+            try:
+                if isinstance(data, np.ndarray):
+                    ext = os.path.splitext(path)[1]
+                    params = self._jpeg_params if ext.lower() in self._JPEG_EXTENSIONS else []
+                    ok, encoded = cv2.imencode(ext, data, params)
+                    if not ok:
+                        print(f"Error encoding image for {path}")
+                        continue
+                    data = encoded.tobytes()
+                with open(path, 'wb') as f:
+                    f.write(data)
+            except Exception as e:
+                print(f"Error writing {path}: {e}")
+
+    def __enter__(self):
+        """Context manager entry."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
@@ -1,22 +1,81 @@
 import cv2
 import numpy as np
+import queue
+import threading
 from typing import Optional, Tuple, List
 from .image_processor import ImageProcessor
 from .ocr_engine import OCREngine
 from .pattern_matcher import PatternMatcher, MedicalReading
 
+# Pause after a failed read, so a disconnected camera does not spin a core
+_READ_RETRY_DELAY = 0.01
+# Consecutive failed reads (about 1 s at the retry delay) after which the source is given up on
+_MAX_READ_FAILURES = 100
+
+class _CaptureThread(threading.Thread):
+    """Background reader that keeps the most recent camera frames queued."""
+
+    def __init__(self, cap: cv2.VideoCapture, frames: queue.Queue, stop_event: threading.Event,
+                 max_read_failures: int = _MAX_READ_FAILURES):
+        """
+        Initialize the capture thread.
+
+        Args:
+            cap: Opened video capture to read from
+            frames: Bounded queue receiving captured frames
+            stop_event: Event signalling the thread to exit
+            max_read_failures: Consecutive failed reads after which the thread exits
+        """
+        super().__init__(daemon=True)
+        self.cap = cap
+        self.frames = frames
+        self.stop_event = stop_event
+        self.max_read_failures = max_read_failures
+
+    def run(self) -> None:
+        """
+        Read frames until stopped, dropping the oldest frame when the queue is full.
+
+        A failed read is retried after a short wait; after max_read_failures
+        failures in a row (camera unplugged, video file exhausted) the thread exits.
+        """
+        failures = 0
+        while not self.stop_event.is_set():
+            ret, frame = self.cap.read()
+            if not ret:
+                failures += 1
+                if failures >= self.max_read_failures:
+                    print(f"Capture stopped after {failures} consecutive failed reads")
+                    break
+                self.stop_event.wait(_READ_RETRY_DELAY)
+                continue
+            failures = 0
+            try:
+                self.frames.put_nowait(frame)
+            except queue.Full:
+                try:
+                    self.frames.get_nowait()
+                except queue.Empty:
+                    pass
+                self.frames.put_nowait(frame)
+
 class ImageCapture:
     """Handles image capture and processing for medical device readings."""
     
-    def __init__(self, camera_id: int = 0):
+    def __init__(self, camera_id: int = 0, frame_timeout: float = 1.0):
         """
         Initialize the image capture system.
         
         Args:
             camera_id: ID of the camera to use (default: 0 for primary camera)
+            frame_timeout: Seconds to wait for a frame from the capture thread
         """
         self.camera_id = camera_id
+        self.frame_timeout = frame_timeout
         self.cap = None
+        self._frames = queue.Queue(maxsize=2)
+        self._stop_event = threading.Event()
+        self._capture_thread = None
         self.image_processor = ImageProcessor()
         self.ocr_engine = OCREngine()
         self.pattern_matcher = PatternMatcher()
@@ -30,16 +89,29 @@ class ImageCapture:
         """
         try:
             self.cap = cv2.VideoCapture(self.camera_id)
-            return self.cap.isOpened()
+            if not self.cap.isOpened():
+                return False
+            # Keep the driver from queueing stale frames behind our own queue
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            self._stop_event.clear()
+            self._capture_thread = _CaptureThread(self.cap, self._frames, self._stop_event)
+            self._capture_thread.start()
+            return True
         except Exception as e:
             print(f"Error starting camera: {e}")
             return False
             
     def stop_camera(self) -> None:
         """Stop the camera capture."""
+        if self._capture_thread is not None:
+            self._stop_event.set()
+            self._capture_thread.join()
+            self._capture_thread = None
         if self.cap is not None:
             self.cap.release()
             self.cap = None
+        while not self._frames.empty():
+            self._frames.get_nowait()
             
     def capture_frame(self) -> Optional[np.ndarray]:
         """
@@ -51,11 +123,10 @@ class ImageCapture:
         if self.cap is None or not self.cap.isOpened():
             return None
             
-        ret, frame = self.cap.read()
-        if not ret:
+        try:
+            return self._frames.get(timeout=self.frame_timeout)
+        except queue.Empty:
             return None
-            
-        return frame
         
     def process_frame(self, frame: np.ndarray) -> Tuple[str, float, List[MedicalReading]]:
         """
@@ -77,6 +148,23 @@ class ImageCapture:
         readings = self.pattern_matcher.find_readings(text, confidence)
         
         return text, confidence, readings
+
+    def process_frames(self, frames: List[np.ndarray]) -> List[Tuple[str, float, List[MedicalReading]]]:
+        """
+        Process several captured frames, running OCR on them as one batch.
+        
+        Args:
+            frames: Captured frames as numpy arrays
+            
+        Returns:
+            List[Tuple[str, float, List[MedicalReading]]]: (extracted text, confidence, list of readings) per frame
+        """
+        processed = [self.image_processor.preprocess_for_ocr(frame) for frame in frames]
+        ocr_results = self.ocr_engine.extract_batch(processed)
+        return [
+            (text, confidence, self.pattern_matcher.find_readings(text, confidence))
+            for text, confidence in ocr_results
+        ]
         
     def capture_and_process(self) -> Tuple[Optional[np.ndarray], str, float, List[MedicalReading]]:
         """
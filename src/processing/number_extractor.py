@@ -1,9 +1,53 @@
 import re
-from typing import List, Tuple, Optional
-from dataclasses import dataclass
+import threading
+import numpy as np
+from typing import Callable, Dict, List, NamedTuple, Tuple, Optional
 
-@dataclass
-class ExtractedNumber:
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# CRLF or lone CR, for normalizing line endings in one pass
+_LINE_BREAK = re.compile(r'\r\n?')
+
+# Lookaround assertions such as (?<!\d), which RE2 cannot compile; none nest parentheses
+_LOOKAROUND = re.compile(r'\(\?<?[!=][^()]*\)')
+
+# Unit strings shared by every extracted number instead of rebuilt per match
+_MMHG = 'mmHg'
+_DEG_F = '°F'
+_DEG_C = '°C'
+_LBS = 'lbs'
+_KG = 'kg'
+_PERCENT = '%'
+_BPM = 'BPM'
+
+# Reading type -> function mapping a match's raw text to its unit
+_UNIT_RESOLVERS: Dict[str, Callable[[str], str]] = {
+    'blood_pressure': lambda raw_text: _MMHG,
+    'temperature': lambda raw_text: _DEG_F if 'F' in raw_text.upper() else _DEG_C,
+    'weight': lambda raw_text: _LBS if 'lbs' in raw_text.lower() else _KG,
+    'oxygen': lambda raw_text: _PERCENT,
+    'heart_rate': lambda raw_text: _BPM,
+}
+
+# Basic range validations per unit
+_VALID_RANGES = {
+    _MMHG: (60, 200),    # Blood pressure
+    _DEG_F: (95, 105),   # Temperature
+    _DEG_C: (35, 41),    # Temperature
+    _LBS: (50, 500),     # Weight
+    _KG: (20, 250),      # Weight
+    _PERCENT: (70, 100), # Oxygen saturation
+    _BPM: (40, 200),     # Heart rate
+}
+
+# Row per known unit plus a final unbounded row for unknown units (always valid)
+_UNIT_ID = {unit: i for i, unit in enumerate(_VALID_RANGES)}
+_RANGE_TABLE = np.array(list(_VALID_RANGES.values()) + [(-np.inf, np.inf)], dtype=np.float64)
+
+class ExtractedNumber(NamedTuple):
     """Class to hold extracted number information."""
     value: float
     unit: Optional[str]
@@ -16,59 +60,135 @@ class NumberExtractor:
     # Common patterns for medical readings with units in different positions
     PATTERNS = {
         'blood_pressure': [
-            r'(\d{2,3})[/-](\d{2,3})',  # 120/80
-            r'(\d{2,3})[/-](\d{2,3})\s*(?:mmHg|BP)?',  # 120/80 mmHg
-            r'(?:mmHg|BP)\s*(\d{2,3})[/-](\d{2,3})',  # mmHg 120/80
-            r'BP:?\s*(\d{2,3})[/-](\d{2,3})',  # BP: 120/80
-            r'(?:mmHg|BP)\n(\d{2,3})[/-](\d{2,3})',  # mmHg\n120/80 (unit above)
-            r'(\d{2,3})[/-](\d{2,3})\n(?:mmHg|BP)',  # 120/80\nmmHg (unit below)
+            # One pattern covers 120/80 with or without BP/mmHg labels on either side or line;
+            # digit guards stop it matching inside longer numbers
+            r'(?<!\d)(\d{2,3})[ \t]?[/-][ \t]?(\d{2,3})(?!\d)',  # 120/80, BP: 120/80, 120/80 mmHg
         ],
         'temperature': [
-            r'(\d{2,3}\.\d{1,2})[°]?[FC]',  # 98.6°F
-            r'[°]?[FC]\s*(\d{2,3}\.\d{1,2})',  # F98.6
-            r'(\d{2,3}\.\d{1,2})[°]?[FC]\s*$',  # 98.6F at end
-            r'^[°]?[FC]\s*(\d{2,3}\.\d{1,2})',  # F98.6 at start
-            r'[°]?[FC]\n(\d{2,3}\.\d{1,2})',  # F\n98.6 (unit above)
-            r'(\d{2,3}\.\d{1,2})\n[°]?[FC]',  # 98.6\nF (unit below)
+            r'(?<!\d)(\d{2,3}\.\d{1,2})[°]?[FC]',  # 98.6°F
+            r'[°]?[FC]\s*(?<!\d)(\d{2,3}\.\d{1,2})',  # F98.6
+            r'(?<!\d)(\d{2,3}\.\d{1,2})[°]?[FC]\s*$',  # 98.6F at end
+            r'^[°]?[FC]\s*(?<!\d)(\d{2,3}\.\d{1,2})',  # F98.6 at start
+            r'[°]?[FC]\n(?<!\d)(\d{2,3}\.\d{1,2})',  # F\n98.6 (unit above)
+            r'(?<!\d)(\d{2,3}\.\d{1,2})\n[°]?[FC]',  # 98.6\nF (unit below)
         ],
         'weight': [
-            r'(\d{2,3}\.\d{1,2})\s*(?:lbs|kg)',  # 150.5 lbs
-            r'(?:lbs|kg)\s*(\d{2,3}\.\d{1,2})',  # lbs 150.5
-            r'WT:?\s*(\d{2,3}\.\d{1,2})\s*(?:lbs|kg)',  # WT: 150.5 lbs
-            r'(?:lbs|kg)\n(\d{2,3}\.\d{1,2})',  # lbs\n150.5 (unit above)
-            r'(\d{2,3}\.\d{1,2})\n(?:lbs|kg)',  # 150.5\nlbs (unit below)
-            r'(?:kg|kilos?)\n(\d{2,3}\.\d{1,2})',  # kg\n68.2 (unit above)
-            r'(\d{2,3}\.\d{1,2})\n(?:kg|kilos?)',  # 68.2\nkg (unit below)
+            r'(?<!\d)(\d{2,3}\.\d{1,2})\s*(?:lbs|kg)',  # 150.5 lbs
+            r'(?:lbs|kg)\s*(?<!\d)(\d{2,3}\.\d{1,2})',  # lbs 150.5
+            r'WT:?\s*(?<!\d)(\d{2,3}\.\d{1,2})\s*(?:lbs|kg)',  # WT: 150.5 lbs
+            r'(?:lbs|kg)\n(?<!\d)(\d{2,3}\.\d{1,2})',  # lbs\n150.5 (unit above)
+            r'(?<!\d)(\d{2,3}\.\d{1,2})\n(?:lbs|kg)',  # 150.5\nlbs (unit below)
+            r'(?:kg|kilos?)\n(?<!\d)(\d{2,3}\.\d{1,2})',  # kg\n68.2 (unit above)
+            r'(?<!\d)(\d{2,3}\.\d{1,2})\n(?:kg|kilos?)',  # 68.2\nkg (unit below)
         ],
         'oxygen': [
-            r'(\d{2,3})\s*%',  # 98%
-            r'%\s*(\d{2,3})',  # %98
-            r'SpO2:?\s*(\d{2,3})\s*%',  # SpO2: 98%
-            r'O2:?\s*(\d{2,3})\s*%',  # O2: 98%
-            r'%\n(\d{2,3})',  # %\n98 (unit above)
-            r'(\d{2,3})\n%',  # 98\n% (unit below)
-            r'SpO2:?\n(\d{2,3})\s*%',  # SpO2:\n98% (label above)
-            r'O2:?\n(\d{2,3})\s*%',  # O2:\n98% (label above)
-            r'SpO2:?\s*(\d{2,3})\n%',  # SpO2: 98\n% (unit below)
-            r'O2:?\s*(\d{2,3})\n%',  # O2: 98\n% (unit below)
+            r'(?<!\d)(\d{2,3})\s*%',  # 98%
+            r'%\s*(?<!\d)(\d{2,3})',  # %98
+            r'SpO2:?\s*(?<!\d)(\d{2,3})\s*%',  # SpO2: 98%
+            r'O2:?\s*(?<!\d)(\d{2,3})\s*%',  # O2: 98%
+            r'%\n(?<!\d)(\d{2,3})',  # %\n98 (unit above)
+            r'(?<!\d)(\d{2,3})\n%',  # 98\n% (unit below)
+            r'SpO2:?\n(?<!\d)(\d{2,3})\s*%',  # SpO2:\n98% (label above)
+            r'O2:?\n(?<!\d)(\d{2,3})\s*%',  # O2:\n98% (label above)
+            r'SpO2:?\s*(?<!\d)(\d{2,3})\n%',  # SpO2: 98\n% (unit below)
+            r'O2:?\s*(?<!\d)(\d{2,3})\n%',  # O2: 98\n% (unit below)
         ],
         'heart_rate': [
-            r'(\d{2,3})\s*(?:BPM|HR)',  # 72 BPM
-            r'(?:BPM|HR)\s*(\d{2,3})',  # BPM 72
-            r'HR:?\s*(\d{2,3})',  # HR: 72
-            r'(?:BPM|HR)\n(\d{2,3})',  # BPM\n72 (unit above)
-            r'(\d{2,3})\n(?:BPM|HR)',  # 72\nBPM (unit below)
-            r'HR:?\n(\d{2,3})',  # HR:\n72 (label above)
-            r'HR:?\s*(\d{2,3})\nBPM',  # HR: 72\nBPM (unit below)
+            r'(?<!\d)(\d{2,3})\s*(?:BPM|HR)',  # 72 BPM
+            r'(?:BPM|HR)\s*(?<!\d)(\d{2,3})',  # BPM 72
+            r'HR:?\s*(?<!\d)(\d{2,3})',  # HR: 72
+            r'(?:BPM|HR)\n(?<!\d)(\d{2,3})',  # BPM\n72 (unit above)
+            r'(?<!\d)(\d{2,3})\n(?:BPM|HR)',  # 72\nBPM (unit below)
+            r'HR:?\n(?<!\d)(\d{2,3})',  # HR:\n72 (label above)
+            r'HR:?\s*(?<!\d)(\d{2,3})\nBPM',  # HR: 72\nBPM (unit below)
         ],
     }
     
+    # Literals (lowercase) at least one of which every pattern of the type requires;
+    # a type whose literals are all absent from the text cannot match and is skipped
+    TRIGGERS = {
+        'blood_pressure': ('/', '-'),
+        'temperature': ('f', 'c'),
+        'weight': ('lbs', 'kg', 'kilo'),
+        'oxygen': ('%',),
+        'heart_rate': ('bpm', 'hr'),
+    }
+    
+    # Combined patterns shared by all instances of a class, built on its first
+    # construction; each subclass gets its own, since it may override PATTERNS
+    _COMPILED: Optional[Dict[str, re.Pattern]] = None
+    # RE2 versions of the combined patterns (google-re2 installed only), used
+    # to reject a reading type in one linear-time scan before running re
+    _DFA_GATES: Dict[str, object] = {}
+    _COMPILE_LOCK = threading.Lock()
+    
     def __init__(self):
-        """Initialize number extractor with compiled regex patterns."""
-        self.compiled_patterns = {
-            name: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
-            for name, patterns in self.PATTERNS.items()
-        }
+        """Initialize number extractor with one combined regex per reading type."""
+        # Look in the class's own namespace so a subclass never reuses its base's patterns
+        cls = type(self)
+        compiled = cls.__dict__.get('_COMPILED')
+        if compiled is None:
+            with NumberExtractor._COMPILE_LOCK:
+                compiled = cls.__dict__.get('_COMPILED')
+                if compiled is None:
+                    compiled = {
+                        name: self._combine_patterns(name, patterns)
+                        for name, patterns in self.PATTERNS.items()
+                    }
+                    cls._DFA_GATES = self._build_dfa_gates(compiled)
+                    cls._COMPILED = compiled
+        self.compiled_patterns = compiled
+    
+    @staticmethod
+    def _build_dfa_gates(compiled: Dict[str, re.Pattern]) -> Dict[str, object]:
+        """
+        Compile RE2 gates for the combined patterns, if google-re2 is installed.
+        
+        RE2 has no lookarounds, so they are removed. That only widens what a
+        gate accepts; the re patterns still decide what is extracted.
+        
+        Args:
+            compiled: Combined re pattern per reading type
+            
+        Returns:
+            Dict[str, object]: RE2 pattern per reading type RE2 could compile
+        """
+        if re2 is None:
+            return {}
+        gates = {}
+        for name, pattern in compiled.items():
+            try:
+                gates[name] = re2.compile(_LOOKAROUND.sub('', pattern.pattern))
+            except Exception:
+                continue
+        return gates
+    
+    @staticmethod
+    def _combine_patterns(name: str, patterns: List[str]) -> re.Pattern:
+        """
+        Fuse a reading type's patterns into a single alternation.
+        
+        Each alternative is wrapped in a named group (e.g. `oxygen_2`), so a
+        match's `lastindex` points at the alternative that matched and its
+        numeric groups follow immediately after it. The text is then scanned
+        once per reading type instead of once per pattern, and overlapping
+        hits from several variants of the same reading are no longer reported
+        more than once.
+        
+        The combined pattern is lowercased and compiled case-sensitively; it is
+        matched against lowercased text, which replaces per-character case
+        folding inside the regex engine with one str.lower() pass. Patterns
+        must therefore not use uppercase escapes such as \\D or \\S.
+        
+        Args:
+            name: Reading type name used to prefix group names
+            patterns: Regex patterns for the reading type, in priority order
+            
+        Returns:
+            re.Pattern: Compiled combined pattern
+        """
+        combined = '|'.join(f'(?P<{name}_{i}>{pattern.lower()})' for i, pattern in enumerate(patterns))
+        return re.compile(combined)
     
     def extract_numbers(self, text: str, confidence: float) -> List[ExtractedNumber]:
         """
@@ -81,46 +201,59 @@ class NumberExtractor:
         Returns:
             List[ExtractedNumber]: List of extracted numbers with metadata
         """
+        return [ExtractedNumber(*fields) for fields in self.extract_number_tuples(text, confidence)]
+    
+    def extract_number_tuples(self, text: str, confidence: float) -> List[Tuple[float, Optional[str], float, str]]:
+        """
+        Extract all numerical values from text as plain tuples.
+        
+        Same results as extract_numbers, as (value, unit, confidence, raw_text)
+        tuples, for callers that only aggregate values and do not need
+        ExtractedNumber objects.
+        
+        Args:
+            text: OCR extracted text
+            confidence: OCR confidence score
+            
+        Returns:
+            List[Tuple[float, Optional[str], float, str]]: One tuple per extracted number
+        """
         results = []
         
-        # Normalize newlines to handle different line endings
-        text = text.replace('\r\n', '\n').replace('\r', '\n')
-        
-        # Try each pattern type
-        for reading_type, patterns in self.compiled_patterns.items():
-            for pattern in patterns:
-                matches = pattern.finditer(text)
-                for match in matches:
-                    if reading_type == 'blood_pressure':
-                        # Handle blood pressure as two numbers
-                        systolic = float(match.group(1))
-                        diastolic = float(match.group(2))
-                        results.extend([
-                            ExtractedNumber(
-                                value=systolic,
-                                unit='mmHg',
-                                confidence=confidence,
-                                raw_text=match.group(0)
-                            ),
-                            ExtractedNumber(
-                                value=diastolic,
-                                unit='mmHg',
-                                confidence=confidence,
-                                raw_text=match.group(0)
-                            )
-                        ])
-                    else:
-                        # Handle single number readings
-                        value = float(match.group(1))
-                        unit = self._get_unit(reading_type, match.group(0))
-                        results.append(
-                            ExtractedNumber(
-                                value=value,
-                                unit=unit,
-                                confidence=confidence,
-                                raw_text=match.group(0)
-                            )
-                        )
+        # Normalize newlines to handle different line endings (Tesseract emits plain '\n',
+        # so skip the rewrite in the common case)
+        if '\r' in text:
+            text = _LINE_BREAK.sub('\n', text)
+        
+        # Patterns are lowercase, so match on lowercased text and take raw_text from
+        # the original by span (lower() only changes length for a few non-ASCII letters)
+        text_lower = text.lower()
+        source = text if len(text_lower) == len(text) else text_lower
+        
+        # Scan once per reading type; numeric groups follow the matched alternative's group.
+        # Loop-invariant lookups are bound to locals since this runs for every OCR'd frame.
+        append = results.append
+        # RE2's \d and \s are ASCII-only, so its gates only screen ASCII text
+        dfa_gates = self._DFA_GATES if text_lower.isascii() else {}
+        for reading_type, pattern in self.compiled_patterns.items():
+            if not any(trigger in text_lower for trigger in self.TRIGGERS[reading_type]):
+                continue
+            gate = dfa_gates.get(reading_type)
+            if gate is not None and not gate.search(text_lower):
+                continue
+            get_unit = _UNIT_RESOLVERS[reading_type]
+            is_blood_pressure = reading_type == 'blood_pressure'
+            for match in pattern.finditer(text_lower):
+                first = match.lastindex + 1
+                raw_text = source[match.start():match.end()]
+                if is_blood_pressure:
+                    # Handle blood pressure as two numbers
+                    systolic, diastolic = match.group(first, first + 1)
+                    append((float(systolic), _MMHG, confidence, raw_text))
+                    append((float(diastolic), _MMHG, confidence, raw_text))
+                else:
+                    # Handle single number readings
+                    append((float(match.group(first)), get_unit(raw_text), confidence, raw_text))
         
         return results
     
@@ -135,13 +268,8 @@ class NumberExtractor:
         Returns:
             Optional[str]: Unit string or None
         """
-        unit_map = {
-            'temperature': '°F' if 'F' in raw_text.upper() else '°C',
-            'weight': 'lbs' if 'lbs' in raw_text.lower() else 'kg',
-            'oxygen': '%',
-            'heart_rate': 'BPM'
-        }
-        return unit_map.get(reading_type)
+        resolver = _UNIT_RESOLVERS.get(reading_type)
+        return resolver(raw_text) if resolver else None
     
     def validate_reading(self, number: ExtractedNumber) -> bool:
         """
@@ -153,19 +281,28 @@ class NumberExtractor:
         Returns:
             bool: True if reading is within valid range
         """
-        # Basic range validations
-        ranges = {
-            'mmHg': (60, 200),  # Blood pressure
-            '°F': (95, 105),    # Temperature
-            '°C': (35, 41),     # Temperature
-            'lbs': (50, 500),   # Weight
-            'kg': (20, 250),    # Weight
-            '%': (70, 100),     # Oxygen saturation
-            'BPM': (40, 200)    # Heart rate
-        }
-        
-        if number.unit in ranges:
-            min_val, max_val = ranges[number.unit]
+        if number.unit in _VALID_RANGES:
+            min_val, max_val = _VALID_RANGES[number.unit]
             return min_val <= number.value <= max_val
         
-        return True  # Unknown units are considered valid 
\ No newline at end of file
+        return True  # Unknown units are considered valid
+    
+    def validate_readings(self, numbers: List[ExtractedNumber]) -> np.ndarray:
+        """
+        Validate many extracted numbers at once.
+        
+        Equivalent to calling validate_reading on each number, but the range
+        checks run as a single vectorized comparison.
+        
+        Args:
+            numbers: Extracted numbers to validate
+            
+        Returns:
+            numpy.ndarray: Boolean array, True where the reading is within its valid range
+        """
+        count = len(numbers)
+        unknown = len(_VALID_RANGES)
+        values = np.fromiter((n.value for n in numbers), dtype=np.float64, count=count)
+        unit_ids = np.fromiter((_UNIT_ID.get(n.unit, unknown) for n in numbers), dtype=np.intp, count=count)
+        bounds = _RANGE_TABLE[unit_ids]
+        return (values >= bounds[:, 0]) & (values <= bounds[:, 1])
@@ -1,18 +1,214 @@
+import functools
+import hashlib
+import os
+import threading
+from collections import OrderedDict
 import pytesseract
-from typing import Dict, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 import cv2
 import numpy as np
+from PIL import Image
+
+from .word_data import WordData
+
+# Number of recent OCR results kept per engine for repeated identical images
+_RESULT_CACHE_SIZE = 128
+
+# Columns of Tesseract's image_to_data TSV output
+_TSV_COLUMNS = ('level', 'page_num', 'block_num', 'par_num', 'line_num', 'word_num',
+                'left', 'top', 'width', 'height', 'conf', 'text')
+
+def _prepare_image(image: np.ndarray) -> np.ndarray:
+    """
+    Bring an image into the layout Tesseract consumes cheapest: one contiguous uint8 channel.
+
+    Args:
+        image: Image as numpy array (grayscale, BGR or BGRA; any dtype)
+
+    Returns:
+        numpy.ndarray: C-contiguous uint8 grayscale image
+    """
+    if image.dtype != np.uint8:
+        image = cv2.convertScaleAbs(image)
+    if image.ndim == 3:
+        if image.shape[2] == 1:
+            image = image[:, :, 0]
+        else:
+            code = cv2.COLOR_BGRA2GRAY if image.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+            image = cv2.cvtColor(image, code)
+    return np.ascontiguousarray(image)
+
+def _to_tesseract_image(image: np.ndarray) -> Image.Image:
+    """
+    Wrap an image for handoff to Tesseract as an uncompressed PNM file.
+
+    pytesseract writes its input to a temporary file and defaults to PNG,
+    which costs a zlib encode here and a decode inside Tesseract on every
+    call. PNM is a raw header plus pixel bytes.
+
+    Args:
+        image: Image as numpy array
+
+    Returns:
+        PIL.Image.Image: Image tagged to be saved as PNM
+    """
+    pil_image = Image.fromarray(_prepare_image(image))
+    pil_image.format = 'PPM'
+    return pil_image
+
+def _image_to_data(image: np.ndarray, config: str) -> Dict[str, list]:
+    """
+    Run Tesseract and return its word data in pytesseract's Output.DICT layout.
+
+    The TSV output is parsed column-wise here: rows are transposed with zip
+    and each numeric column is converted with a single map() call, instead of
+    pytesseract's per-cell int(float()) with a try/except around every value.
+
+    Args:
+        image: Image as numpy array
+        config: Tesseract command-line config string
+
+    Returns:
+        Dict[str, list]: Column name -> values; numeric columns hold ints.
+            Every column is present, with empty lists when Tesseract returns no rows
+    """
+    tsv = pytesseract.image_to_data(_to_tesseract_image(image), config=config)
+    rows = [row.split('\t') for row in tsv.strip().split('\n')]
+    if len(rows) < 2:
+        return {name: [] for name in _TSV_COLUMNS}
+    header = rows.pop(0)
+    if len(rows[-1]) < len(header):
+        # The last row has no trailing cell when its text is empty
+        rows[-1].append('')
+    columns = dict(zip(header, map(list, zip(*rows))))
+    for name, values in columns.items():
+        if name == 'conf':
+            columns[name] = list(map(int, map(float, values)))
+        elif name != 'text':
+            columns[name] = list(map(int, values))
+    return columns
+
+@functools.lru_cache(maxsize=64)
+def _config_string(config_items: Tuple[Tuple[str, str], ...]) -> str:
+    """
+    Build the Tesseract command-line config string for a configuration.
+
+    Memoized on the configuration's items, so switching an engine back and
+    forth between PSMs reuses the same strings instead of rebuilding them.
+
+    Args:
+        config_items: Tesseract configuration parameters as (key, value) pairs
+
+    Returns:
+        str: Config string, e.g. '--oem 1 --psm 7 -c tessedit_char_whitelist=...'
+    """
+    config_str = ''
+    for k, v in config_items:
+        if k.startswith('--'):
+            config_str += f'{k} {v} '
+        else:
+            config_str += f'-c {k}={v} '
+    return config_str.strip()
+
+def _recognise(image: np.ndarray, config: str) -> Tuple[str, float]:
+    """
+    Run Tesseract once and return the text and mean word confidence.
+
+    Args:
+        image: Preprocessed image
+        config: Tesseract command-line config string
+
+    Returns:
+        Tuple[str, float]: (extracted text, confidence score), or ("", 0.0) on error
+    """
+    try:
+        data = _image_to_data(image, config)
+    except Exception as e:
+        print(f"Error during OCR: {e}")
+        return "", 0.0
+    return _text_from_data(data), _mean_confidence(data)
+
+def _text_from_data(data: Dict[str, list]) -> str:
+    """
+    Rebuild the plain-text output of image_to_string from image_to_data output.
+
+    Words on the same line are joined with spaces, lines with newlines, and
+    a blank line separates paragraphs and blocks, as Tesseract's text
+    renderer does.
+
+    Args:
+        data: Word data in pytesseract's Output.DICT layout
+
+    Returns:
+        str: Recognised text
+    """
+    lines = []
+    current_key = None
+    current_para = None
+    for i, word in enumerate(data['text']):
+        if not word.strip():
+            continue
+        para = (data['page_num'][i], data['block_num'][i], data['par_num'][i])
+        key = para + (data['line_num'][i],)
+        if key != current_key:
+            if current_para is not None and para != current_para:
+                lines.append('')
+            lines.append(word)
+            current_key, current_para = key, para
+        else:
+            lines[-1] += ' ' + word
+    return '\n'.join(lines)
+
+def _word_mask(data: Dict[str, list]) -> np.ndarray:
+    """
+    Select the entries of image_to_data output that are recognised words.
+
+    Confidences are compared in one vectorised pass; only entries with a
+    non-negative confidence (-1 marks block/line/empty rows) have their text
+    checked for content.
+
+    Args:
+        data: Word data in pytesseract's Output.DICT layout
+
+    Returns:
+        numpy.ndarray: Boolean mask over the entries
+    """
+    mask = np.asarray(data['conf'], dtype=np.float64) >= 0
+    texts = data['text']
+    for i in np.flatnonzero(mask).tolist():
+        if not texts[i].strip():
+            mask[i] = False
+    return mask
+
+def _mean_confidence(data: Dict[str, list]) -> float:
+    """
+    Average word confidence from image_to_data output.
+
+    Args:
+        data: Word data in pytesseract's Output.DICT layout
+
+    Returns:
+        float: Mean confidence (0-100) over non-empty words, or 0.0 if there are none
+    """
+    mask = _word_mask(data)
+    if not mask.any():
+        return 0.0
+    return float(np.trunc(np.asarray(data['conf'], dtype=np.float64)[mask]).mean())
 
 class OCREngine:
     """Wrapper for Tesseract OCR functionality."""
     
-    def __init__(self, config: Optional[Dict] = None, device_type: Optional[str] = None):
+    def __init__(self, config: Optional[Dict] = None, device_type: Optional[str] = None,
+                 use_gpu: bool = False):
         """
         Initialize OCR engine with optional configuration.
         
         Args:
             config: Dictionary of Tesseract configuration parameters
             device_type: Optional string for device type (unused, for compatibility)
+            use_gpu: Recognise in-process with PaddleOCR on the GPU instead of
+                running Tesseract; falls back to Tesseract if paddleocr is not installed
         """
         self.config = config or {
             '--oem': '1',  # Use Legacy + LSTM OCR Engine Mode
@@ -20,6 +216,18 @@ class OCREngine:
             'tessedit_char_whitelist': '0123456789./-ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz',  # Allow letters and numbers
         }
         # device_type is accepted for compatibility but not used
+        # Tesseract command-line config built from self.config; reset by set_psm
+        self._config_str_cache: Optional[str] = None
+        self._paddle = None
+        # Image digest -> (text, confidence), most recently used last
+        self._cache: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        if use_gpu:
+            try:
+                from paddleocr import PaddleOCR
+                self._paddle = PaddleOCR(use_angle_cls=False, lang='en', use_gpu=True, show_log=False)
+            except ImportError:
+                print("paddleocr is not installed, using Tesseract")
         
     def set_psm(self, psm_mode: str) -> None:
         """
@@ -29,6 +237,7 @@ class OCREngine:
             psm_mode: PSM mode as a string (e.g., '3', '6', '7', '8', '13')
         """
         self.config['--psm'] = psm_mode
+        self._config_str_cache = None
 
     def get_psm(self) -> str:
         """
@@ -40,13 +249,9 @@ class OCREngine:
         return self.config.get('--psm', '3') # Default to '3' if somehow not set
 
     def _get_config_string(self) -> str:
-        config_str = ''
-        for k, v in self.config.items():
-            if k.startswith('--'):
-                config_str += f'{k} {v} '
-            else:
-                config_str += f'-c {k}={v} '
-        return config_str.strip()
+        if self._config_str_cache is None:
+            self._config_str_cache = _config_string(tuple(self.config.items()))
+        return self._config_str_cache
 
     def extract_text(self, image: np.ndarray) -> str:
         """
@@ -61,7 +266,7 @@ class OCREngine:
         try:
             config_str = self._get_config_string()
             text = pytesseract.image_to_string(
-                image,
+                _to_tesseract_image(image),
                 config=config_str
             )
             return text.strip()
@@ -81,15 +286,10 @@ class OCREngine:
         """
         try:
             config_str = self._get_config_string()
-            data = pytesseract.image_to_data(
-                image,
-                output_type=pytesseract.Output.DICT,
-                config=config_str
-            )
+            data = _image_to_data(image, config_str)
             
             # Calculate average confidence for non-empty text
-            confidences = [int(conf) for conf, text in zip(data['conf'], data['text']) if text.strip() and int(conf) >= 0] # Filter out -1 confidences (often for empty regions)
-            return sum(confidences) / len(confidences) if confidences else 0.0
+            return _mean_confidence(data)
         except Exception as e:
             print(f"Error getting confidence: {e}") # Consider logging
             return 0.0
@@ -104,41 +304,193 @@ class OCREngine:
         Returns:
             Tuple[str, float]: (extracted text, confidence score)
         """
-        # Note: extract_text and get_confidence will each call _get_config_string.
-        # If performance becomes an issue, this could be optimized by calling image_to_data once.
-        text = self.extract_text(image)
-        confidence = self.get_confidence(image) # This might re-process if not careful or if image_to_data not used for text
-        return text, confidence
+        # A stationary display polled per frame often yields identical images;
+        # serve those from the cache instead of running OCR again
+        key = self._cache_key(image)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+        
+        if self._paddle is not None:
+            result = self._extract_with_paddle(image)
+        else:
+            # A single image_to_data run yields both the words and their confidences,
+            # so Tesseract only recognises the image once
+            try:
+                data = _image_to_data(image, self._get_config_string())
+            except Exception as e:
+                print(f"Error during OCR: {e}")
+                return "", 0.0
+            result = (_text_from_data(data), _mean_confidence(data))
+        
+        with self._cache_lock:
+            self._cache[key] = result
+            if len(self._cache) > _RESULT_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return result
+
+    def _cache_key(self, image: np.ndarray) -> bytes:
+        """
+        Digest identifying an image and the settings it would be recognised with.
+        
+        Args:
+            image: Preprocessed image
+            
+        Returns:
+            bytes: 16-byte BLAKE2b digest
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f'{image.shape}{image.dtype}{self._get_config_string()}'.encode())
+        digest.update(np.ascontiguousarray(image).data)
+        return digest.digest()
+
+    def _extract_with_paddle(self, image: np.ndarray) -> Tuple[str, float]:
+        """
+        Extract text and confidence with the in-process PaddleOCR engine.
+        
+        Args:
+            image: Preprocessed image
+            
+        Returns:
+            Tuple[str, float]: (extracted text, confidence score 0-100)
+        """
+        try:
+            if image.ndim == 2:
+                image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+            lines = self._paddle.ocr(image, cls=False)[0]
+        except Exception as e:
+            print(f"Error during OCR: {e}")
+            return "", 0.0
+        if not lines:
+            return "", 0.0
+        texts = [text for _, (text, _) in lines]
+        scores = [score for _, (_, score) in lines]
+        return '\n'.join(texts), 100.0 * sum(scores) / len(scores)
+
+    def extract_batch(self, images: List[np.ndarray], max_workers: Optional[int] = None,
+                      use_processes: bool = False) -> List[Tuple[str, float]]:
+        """
+        Extract text and confidence from several images at once.
+
+        Each Tesseract call runs in its own subprocess outside the GIL, so by
+        default the images are dispatched to a thread pool and recognised
+        concurrently. With use_processes the pytesseract wrapper work (image
+        encoding, temp files, result parsing) is also spread over worker
+        processes, each rebuilding an engine from this engine's config.
+        
+        Args:
+            images: Preprocessed images
+            max_workers: Maximum number of concurrent OCR calls (default: CPU count)
+            use_processes: Use a process pool instead of a thread pool
+            
+        Returns:
+            List[Tuple[str, float]]: (extracted text, confidence score) per image, in input order
+        """
+        if not images:
+            return []
+        if self._paddle is not None:
+            # The GPU model is shared in-process; run the patches back to back on it
+            return [self._extract_with_paddle(image) for image in images]
+        # More concurrent Tesseract processes than cores only adds contention
+        workers = min(max_workers or os.cpu_count() or 1, len(images))
+        if use_processes:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(_extract_with_config, [self.config] * len(images), images))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.extract_with_confidence, images))
+
+    def extract_multi_psm(self, image: np.ndarray, psms: List[str],
+                          max_workers: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Recognise one image under several page segmentation modes.
+
+        The image is converted for Tesseract once and the per-PSM runs are
+        dispatched concurrently, each in its own Tesseract subprocess. The
+        engine's own PSM setting is left unchanged.
+
+        Args:
+            image: Preprocessed image
+            psms: PSM modes to try, e.g. ['6', '7', '8']
+            max_workers: Maximum number of concurrent OCR calls (default: CPU count)
+
+        Returns:
+            List[Tuple[str, float]]: (extracted text, confidence score) per PSM, in input order
+        """
+        if not psms:
+            return []
+        if self._paddle is not None:
+            # PaddleOCR has no page segmentation modes; one run serves them all
+            return [self._extract_with_paddle(image)] * len(psms)
+        prepared = _prepare_image(image)
+        configs = [_config_string(tuple({**self.config, '--psm': str(psm)}.items())) for psm in psms]
+        workers = min(max_workers or os.cpu_count() or 1, len(configs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_recognise, [prepared] * len(configs), configs))
 
     def extract_detailed_data(self, image: np.ndarray) -> list[dict]:
         try:
-            data = pytesseract.image_to_data(
-                image,
-                output_type=pytesseract.Output.DICT,
-                config=self._get_config_string()
-            )
+            data = _image_to_data(image, self._get_config_string())
             char_list = []
-            num_items = len(data['text'])
-            for i in range(num_items):
-                if int(data['conf'][i]) > -1 and data['text'][i].strip(): # Only process actual characters
-                    char_list.append({
-                        'level': data['level'][i],
-                        'page_num': data['page_num'][i],
-                        'block_num': data['block_num'][i],
-                        'par_num': data['par_num'][i],
-                        'line_num': data['line_num'][i],
-                        'word_num': data['word_num'][i],
-                        'left': data['left'][i],
-                        'top': data['top'][i],
-                        'width': data['width'][i],
-                        'height': data['height'][i],
-                        'conf': float(data['conf'][i]), # Ensure conf is float
-                        'text': data['text'][i]
-                    })
+            for i in np.flatnonzero(_word_mask(data)).tolist(): # Only process actual characters
+                char_list.append({
+                    'level': data['level'][i],
+                    'page_num': data['page_num'][i],
+                    'block_num': data['block_num'][i],
+                    'par_num': data['par_num'][i],
+                    'line_num': data['line_num'][i],
+                    'word_num': data['word_num'][i],
+                    'left': data['left'][i],
+                    'top': data['top'][i],
+                    'width': data['width'][i],
+                    'height': data['height'][i],
+                    'conf': float(data['conf'][i]), # Ensure conf is float
+                    'text': data['text'][i]
+                })
             return char_list
         except Exception as e:
             print(f"Error during detailed OCR data extraction: {e}")
-            feature/pattern-matcher-enhancements
-            return []
             return []
-          main
+
+    def extract_word_arrays(self, image: np.ndarray) -> WordData:
+        """
+        Extract recognised words and their boxes as parallel arrays.
+
+        Same words as extract_detailed_data, but confidences and boxes are
+        numpy arrays so callers can filter them in vectorised passes.
+
+        Args:
+            image: Preprocessed image
+
+        Returns:
+            WordData: Recognised words (empty if OCR fails)
+        """
+        try:
+            data = _image_to_data(image, self._get_config_string())
+            words = np.flatnonzero(_word_mask(data))
+            texts = data['text']
+            return WordData(
+                text=[texts[i] for i in words.tolist()],
+                conf=np.asarray(data['conf'], dtype=np.float64)[words],
+                left=np.asarray(data['left'], dtype=np.int32)[words],
+                top=np.asarray(data['top'], dtype=np.int32)[words],
+                width=np.asarray(data['width'], dtype=np.int32)[words],
+                height=np.asarray(data['height'], dtype=np.int32)[words],
+            )
+        except Exception as e:
+            print(f"Error during detailed OCR data extraction: {e}")
+            return WordData.empty()
+
+def _extract_with_config(config: Dict, image: np.ndarray) -> Tuple[str, float]:
+    """
+    Process-pool worker for OCREngine.extract_batch.
+
+    Args:
+        config: Tesseract configuration of the calling engine
+        image: Preprocessed image
+
+    Returns:
+        Tuple[str, float]: (extracted text, confidence score)
+    """
+    return OCREngine(config=dict(config)).extract_with_confidence(image)
@@ -1,7 +1,25 @@
+import functools
+import itertools
+import os
 import re
-from typing import List, Dict, Any, Tuple
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Dict, Any, NamedTuple, Optional, Pattern, Tuple, Union
 from enum import Enum
 
+import numpy as np
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 class ReadingType(Enum):
     TEMPERATURE = "Temperature"
     WEIGHT = "Weight"
@@ -13,43 +31,299 @@ class ReadingType(Enum):
     PAIN_SCALE = "Pain Scale"
     HEIGHT = "Height"
 
-class MedicalReading:
-    def __init__(self, type: ReadingType, value: float, unit: str, is_valid: bool = True):
-        self.type = type
-        self.value = value
-        self.unit = unit
-        self.is_valid = is_valid
+class MedicalReading(NamedTuple):
+    # Immutable, so memoized readings can be handed to every caller
+    type: ReadingType
+    value: float
+    unit: str
+    is_valid: bool = True
+
+# Every reading pattern captures at least one digit, so lines without one are skipped
+_DIGIT = re.compile(r'\d')
+
+# Normal (min, max) range per (reading type, unit); blood pressure has one
+# entry each for the systolic and diastolic values
+_SYSTOLIC_KEY = (ReadingType.BLOOD_PRESSURE, 'systolic')
+_DIASTOLIC_KEY = (ReadingType.BLOOD_PRESSURE, 'diastolic')
+_VALID_RANGES = {
+    (ReadingType.TEMPERATURE, 'F'): (95.0, 104.0),
+    (ReadingType.TEMPERATURE, 'C'): (35.0, 40.0),
+    (ReadingType.WEIGHT, 'kg'): (20.0, 200.0),
+    (ReadingType.WEIGHT, 'lb'): (44.0, 440.0),
+    _SYSTOLIC_KEY: (90, 140),
+    _DIASTOLIC_KEY: (60, 90),
+    (ReadingType.OXYGEN, '%'): (70, 100),
+    (ReadingType.HEART_RATE, 'BPM'): (40, 200),
+    (ReadingType.BLOOD_GLUCOSE, 'mmol/L'): (2.8, 22.2),
+    (ReadingType.BLOOD_GLUCOSE, 'mg/dL'): (50, 400),
+    (ReadingType.RESPIRATORY_RATE, 'breaths/min'): (8, 40),
+    (ReadingType.PAIN_SCALE, '/10'): (0, 10),
+    (ReadingType.HEIGHT, 'cm'): (30.0, 250.0),
+    (ReadingType.HEIGHT, 'in'): (12.0, 100.0),
+}
+
+# Unit for types whose matches don't spell one out
+_DEFAULT_UNITS = {
+    ReadingType.OXYGEN: '%',
+    ReadingType.HEART_RATE: 'BPM',
+    ReadingType.RESPIRATORY_RATE: 'breaths/min',
+    ReadingType.PAIN_SCALE: '/10',
+    ReadingType.HEIGHT: 'cm',  # Added default unit for height
+}
+
+# A whole temperature reading: 98.6F / 98.6 °F, or F98.6 with the unit first
+_TEMP_FORMAT = re.compile(r'\d+(?:\.\d+)?\s*°?[FCfc]|°?[FCfc]\s*\d+(?:\.\d+)?')
+
+def _weight_unit(matched: str) -> str:
+    """Unit of a lowercased weight match: 'kg' for kg/kilo(s)/kilogram(s), else 'lb'."""
+    return 'kg' if 'k' in matched else 'lb'
+
+# Distinct texts whose readings / temperature checks are memoized
+_READINGS_CACHE_SIZE = 4096
+
+# Smallest find_readings_batch input worth spreading over worker processes
+_PARALLEL_MIN_BATCH = 256
+
+# Types whose patterns are case-sensitive and so run on the line as written
+_CASE_SENSITIVE_TYPES = frozenset({ReadingType.BLOOD_PRESSURE, ReadingType.OXYGEN})
+
+# A P: line is read as a pain score rather than a pulse when it has an "N/10" score
+_OUT_OF_TEN = re.compile(r'\d+\s*(/10|out of 10)', re.IGNORECASE)
+
+# ReadingType members in declaration order, indexed by ReadingsBatch.types
+_READING_TYPES = list(ReadingType)
+_READING_TYPE_CODES = {rt: i for i, rt in enumerate(_READING_TYPES)}
+
+@dataclass
+class ReadingsBatch:
+    """Readings stored as parallel arrays so aggregates run as vectorized numpy ops.
+
+    Entry i of each field describes the same reading. `types` holds indices
+    into ReadingType declaration order.
+    """
+    types: np.ndarray
+    values: np.ndarray
+    units: List[str]
+    is_valid: np.ndarray
+    confidence: np.ndarray
+
+    @classmethod
+    def from_readings(cls, readings: List[MedicalReading], confidence: float) -> 'ReadingsBatch':
+        """Build a batch from a list of readings sharing one OCR confidence."""
+        n = len(readings)
+        return cls(
+            types=np.fromiter((_READING_TYPE_CODES[r.type] for r in readings), dtype=np.int8, count=n),
+            values=np.fromiter((r.value for r in readings), dtype=np.float64, count=n),
+            units=[r.unit for r in readings],
+            is_valid=np.fromiter((r.is_valid for r in readings), dtype=np.bool_, count=n),
+            confidence=np.full(n, confidence, dtype=np.float32),
+        )
+
+    @classmethod
+    def concat(cls, batches: List['ReadingsBatch']) -> 'ReadingsBatch':
+        """Join batches (e.g. one per OCR text) into a single batch."""
+        if not batches:
+            return cls.from_readings([], 0.0)
+        return cls(
+            types=np.concatenate([b.types for b in batches]),
+            values=np.concatenate([b.values for b in batches]),
+            units=[unit for b in batches for unit in b.units],
+            is_valid=np.concatenate([b.is_valid for b in batches]),
+            confidence=np.concatenate([b.confidence for b in batches]),
+        )
+
+    def to_readings(self) -> List[MedicalReading]:
+        """Convert the batch back into MedicalReading objects."""
+        return [
+            MedicalReading(type=_READING_TYPES[t], value=v, unit=u, is_valid=bool(ok))
+            for t, v, u, ok in zip(self.types.tolist(), self.values.tolist(), self.units, self.is_valid)
+        ]
 
-class ValidationResult:
-    def __init__(self, is_valid: bool, confidence_adjustment: float, error_reason: str = None, suggested_correction: str = None):
-        self.is_valid = is_valid
-        self.confidence_adjustment = confidence_adjustment
-        self.error_reason = error_reason
-        self.suggested_correction = suggested_correction
+    def type_counts(self, valid_only: bool = True) -> np.ndarray:
+        """Count readings per ReadingType (in declaration order)."""
+        types = self.types[self.is_valid] if valid_only else self.types
+        return np.bincount(types, minlength=len(_READING_TYPES))
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+class ValidationResult(NamedTuple):
+    is_valid: bool
+    confidence_adjustment: float
+    error_reason: Optional[str] = None
+    suggested_correction: Optional[str] = None
+
+# Negative lookarounds such as (?!m) or (?!\s*RR); none of them nest parentheses
+_NEGATIVE_LOOKAROUND = re.compile(r'\(\?<?![^()]*\)')
+
+class _DfaGate:
+    """Combined pattern whose search runs on RE2 for ASCII lines.
+
+    RE2 has no lookarounds, so the RE2 side is compiled with them removed.
+    That only widens the match, which is fine for a gate: the individual
+    patterns still decide what is extracted. RE2's \\d, \\s and \\b are
+    ASCII-only, so non-ASCII lines use the backtracking pattern instead.
+    """
+    __slots__ = ('pattern', 'dfa')
+
+    def __init__(self, pattern: Pattern, dfa):
+        self.pattern = pattern
+        self.dfa = dfa
+
+    def search(self, line: str):
+        if line.isascii():
+            return self.dfa.search(line)
+        return self.pattern.search(line)
+
+def _combine_patterns(patterns: List[Pattern]) -> Pattern:
+    """Fuse compiled patterns into one alternation that matches wherever any of them does.
+
+    Each alternative keeps its own case sensitivity via a scoped inline flag.
+    When google-re2 is installed the result is wrapped so that searches run
+    as a single linear-time DFA scan.
+    """
+    parts = []
+    for pattern in patterns:
+        body = f'(?i:{pattern.pattern})' if pattern.flags & re.IGNORECASE else pattern.pattern
+        parts.append(f'(?:{body})')
+    combined = re.compile('|'.join(parts))
+    if re2 is None:
+        return combined
+    try:
+        dfa = re2.compile(_NEGATIVE_LOOKAROUND.sub('', combined.pattern))
+    except Exception:
+        return combined
+    return _DfaGate(combined, dfa)
+
+def _collect_type(pattern_id: int, start: int, end: int, flags: int, context: set) -> None:
+    """Hyperscan match callback: record the matched pattern's reading type."""
+    context.add(_READING_TYPES[pattern_id])
+
+# Per-type parsers turning a match into (value, unit). Unit letters are the only
+# letters these matches can hold, so a substring test on the short (lowercased)
+# match text is enough to tell units apart.
+
+def _parse_temperature(match: re.Match) -> Tuple[float, str]:
+    return float(match.group(1)), 'F' if 'f' in match.group(0) else 'C'
+
+def _parse_weight(match: re.Match) -> Tuple[float, str]:
+    return float(match.group(1)), _weight_unit(match.group(0))
+
+def _parse_glucose(match: re.Match) -> Tuple[float, str]:
+    return float(match.group(1)), 'mmol/L' if 'mmol' in match.group(0) else 'mg/dL'
+
+def _parse_blood_pressure(match: re.Match) -> Tuple[int, Tuple[int, int]]:
+    # The (systolic, diastolic) pair stands in for the "120/80 mmHg" unit string,
+    # which is only formatted for readings that survive deduplication
+    systolic, diastolic = match.group(1, 2)
+    systolic = int(systolic)
+    return systolic, (systolic, int(diastolic))
+
+def _parse_height(match: re.Match) -> Tuple[float, str]:
+    # Metric patterns capture only the value; feet/inches patterns capture both parts
+    # (a unit test on the text would miss spellings such as "centimeters")
+    if match.re.groups == 1:
+        return float(match.group(1)), 'cm'
+    feet, inches = match.group(1, 2)
+    return int(feet) * 12 + int(inches), 'in'
+
+def _parse_oxygen(match: re.Match) -> Tuple[float, str]:
+    return float(match.group(1)), '%'
+
+def _parse_pain_scale(match: re.Match) -> Tuple[float, str]:
+    return float(match.group(1)), '/10'
+
+# HR/RESP label patterns (HR:, P:, R: ...) capture the value in group 2
+
+def _parse_heart_rate(match: re.Match) -> Tuple[float, str]:
+    return float(match.group(match.lastindex)), 'BPM'
+
+def _parse_respiratory_rate(match: re.Match) -> Tuple[float, str]:
+    return float(match.group(match.lastindex)), 'breaths/min'
+
+_PARSERS = {
+    ReadingType.TEMPERATURE: _parse_temperature,
+    ReadingType.WEIGHT: _parse_weight,
+    ReadingType.BLOOD_PRESSURE: _parse_blood_pressure,
+    ReadingType.OXYGEN: _parse_oxygen,
+    ReadingType.HEART_RATE: _parse_heart_rate,
+    ReadingType.BLOOD_GLUCOSE: _parse_glucose,
+    ReadingType.RESPIRATORY_RATE: _parse_respiratory_rate,
+    ReadingType.PAIN_SCALE: _parse_pain_scale,
+    ReadingType.HEIGHT: _parse_height,
+}
+
+class _HyperscanGate:
+    """Every reading type's patterns in one Hyperscan database.
+
+    A single block-mode scan of an ASCII line reports each type whose patterns
+    can match it, in place of one combined-pattern search per type. Hyperscan
+    has no lookarounds, so they are dropped as for the RE2 gate; that only
+    widens the candidate set.
+    """
+
+    def __init__(self, database):
+        self._database = database
+
+    @classmethod
+    def build(cls, reading_types) -> Optional['_HyperscanGate']:
+        """Compile a gate for (patterns, combined, type) entries.
+
+        Returns:
+            The gate, or None if Hyperscan is missing or rejects a pattern
+        """
+        if hyperscan is None:
+            return None
+        expressions, ids, flags = [], [], []
+        for patterns, _, reading_type in reading_types:
+            # Lowercase patterns run caselessly on the line as written
+            flag = hyperscan.HS_FLAG_SINGLEMATCH
+            if reading_type not in _CASE_SENSITIVE_TYPES:
+                flag |= hyperscan.HS_FLAG_CASELESS
+            for pattern in patterns:
+                source = _NEGATIVE_LOOKAROUND.sub('', pattern.pattern)
+                # Group multi-byte literals such as ° so a following ? applies to all their bytes
+                source = ''.join(c if c.isascii() else f'(?:{c})' for c in source)
+                expressions.append(source.encode('utf-8'))
+                ids.append(_READING_TYPE_CODES[reading_type])
+                flags.append(flag)
+        try:
+            database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            database.compile(expressions=expressions, ids=ids, elements=len(expressions), flags=flags)
+        except Exception as e:
+            warnings.warn(f"Hyperscan could not compile the reading patterns, using re: {e}",
+                          RuntimeWarning)
+            return None
+        return cls(database)
+
+    def scan(self, line: str) -> set:
+        """Return the reading types whose patterns may match an ASCII line."""
+        found = set()
+        self._database.scan(line.encode('ascii'), match_event_handler=_collect_type, context=found)
+        return found
 
 class PatternMatcher:
-    # Temperature patterns with units in different positions
+    # Patterns of every type except blood pressure and oxygen are written in
+    # lowercase and matched against the lowercased line
+
+    # Temperature patterns with units in different positions. find_readings
+    # works line by line, so unit-above/below (\n) variants could never match;
+    # the end/start-anchored and TEMP:/T: variants always match at the same
+    # number as the two below and so only produced duplicate readings.
     TEMP_PATTERNS = [
-        re.compile(r'(\d+(?:\.\d+)?)\s*[°]?(?:F(?!m)|C(?!m)|f(?!m)|c(?!m))', re.IGNORECASE),  # 98.6F or 37.0C, but not 25 cm
-        re.compile(r'[°]?(?:F(?!m)|C(?!m)|f(?!m)|c(?!m))\s*(\d+(?:\.\d+)?)', re.IGNORECASE),  # F98.6 or C37.0, but not cm
-        re.compile(r'(\d+(?:\.\d+)?)\s*[°]?(?:F(?!m)|C(?!m)|f(?!m)|c(?!m))\s*$', re.IGNORECASE),  # 98.6F at end, not cm
-        re.compile(r'^[°]?(?:F(?!m)|C(?!m)|f(?!m)|c(?!m))\s*(\d+(?:\.\d+)?)', re.IGNORECASE),  # F98.6 at start, not cm
-        re.compile(r'[°]?(?:F(?!m)|C(?!m)|f(?!m)|c(?!m))\n(\d+(?:\.\d+)?)', re.IGNORECASE),  # F\n98.6 (unit above, not cm)
-        re.compile(r'(\d+(?:\.\d+)?)\n[°]?(?:F(?!m)|C(?!m)|f(?!m)|c(?!m))', re.IGNORECASE),  # 98.6\nF (unit below, not cm)
-        re.compile(r'TEMP:?\s*(\d+(?:\.\d+)?)\s*[°]?(?:F(?!m)|C(?!m)|f(?!m)|c(?!m))', re.IGNORECASE),  # TEMP: 98.6F, not cm
-        re.compile(r'T:?\s*(\d+(?:\.\d+)?)\s*[°]?(?:F(?!m)|C(?!m)|f(?!m)|c(?!m))', re.IGNORECASE),  # T: 98.6F, not cm
+        re.compile(r'(\d+(?:\.\d+)?)\s*°?[fc](?!m)'),  # 98.6F or 37.0C, but not 25 cm
+        re.compile(r'°?[fc](?!m)\s*(\d+(?:\.\d+)?)'),  # F98.6 or C37.0, but not cm
     ]
     
-    # Weight patterns with units in different positions
+    # Weight patterns with units in different positions. WT:/W: labelled
+    # readings are matched by the unit patterns at the same number.
     WEIGHT_PATTERNS = [
-        re.compile(r'(\d+(?:\.\d+)?)\s*(?:lbs?|pounds?|lb\.)', re.IGNORECASE),  # 150.5 lbs
-        re.compile(r'(?:lbs?|pounds?|lb\.)\s*(\d+(?:\.\d+)?)', re.IGNORECASE),  # lbs 150.5
-        re.compile(r'(\d+(?:\.\d+)?)\s*(?:kg|kilos?|kilograms?)', re.IGNORECASE),  # 68.2 kg
-        re.compile(r'(?:kg|kilos?|kilograms?)\s*(\d+(?:\.\d+)?)', re.IGNORECASE),  # kg 68.2
-        re.compile(r'WT:?\s*(\d+(?:\.\d+)?)\s*(?:lbs?|kg)', re.IGNORECASE),  # WT: 150.5 lbs
-        re.compile(r'W:?\s*(\d+(?:\.\d+)?)\s*(?:lbs?|kg)', re.IGNORECASE),  # W: 150.5 lbs
-        re.compile(r'(?:lbs?|kg)\n(\d+(?:\.\d+)?)', re.IGNORECASE),  # lbs\n150.5 (unit above)
-        re.compile(r'(\d+(?:\.\d+)?)\n(?:lbs?|kg)', re.IGNORECASE),  # 150.5\nlbs (unit below)
+        re.compile(r'(\d+(?:\.\d+)?)\s*(?:lbs?|pounds?|lb\.)'),  # 150.5 lbs
+        re.compile(r'(?:lbs?|pounds?|lb\.)\s*(\d+(?:\.\d+)?)'),  # lbs 150.5
+        re.compile(r'(\d+(?:\.\d+)?)\s*(?:kg|kilos?|kilograms?)'),  # 68.2 kg
+        re.compile(r'(?:kg|kilos?|kilograms?)\s*(\d+(?:\.\d+)?)'),  # kg 68.2
+        re.compile(r'(?:lbs?|kg)\n(\d+(?:\.\d+)?)'),  # lbs\n150.5 (unit above)
+        re.compile(r'(\d+(?:\.\d+)?)\n(?:lbs?|kg)'),  # 150.5\nlbs (unit below)
     ]
     
     # Blood pressure patterns
@@ -77,242 +351,209 @@ class PatternMatcher:
 
     # Heart rate patterns with units in different positions
     HR_PATTERNS = [
-        re.compile(r'(\d+)\s*(?:BPM|HR)(?!\s*RR)', re.IGNORECASE),  # 72 BPM (not followed by RR)
-        re.compile(r'(?:BPM|HR)(?!\s*RR)\s*(\d+)', re.IGNORECASE),  # BPM 72 (not followed by RR)
-        re.compile(r'(^|\b)HR:?\s*(\d+)(?!\s*RR)', re.IGNORECASE),  # HR: 72 (not followed by RR)
-        re.compile(r'(^|\b)PULSE:?\s*(\d+)(?!\s*RR)', re.IGNORECASE),  # PULSE: 72 (not followed by RR)
-        re.compile(r'(^|\b)P:?\s*(\d+)(?!\s*RR)', re.IGNORECASE),  # P: 72 (not followed by RR)
+        re.compile(r'(\d+)\s*(?:bpm|hr)(?!\s*rr)'),  # 72 BPM (not followed by RR)
+        re.compile(r'(?:bpm|hr)(?!\s*rr)\s*(\d+)'),  # BPM 72 (not followed by RR)
+        re.compile(r'(^|\b)hr:?\s*(\d+)(?!\s*rr)'),  # HR: 72 (not followed by RR)
+        re.compile(r'(^|\b)pulse:?\s*(\d+)(?!\s*rr)'),  # PULSE: 72 (not followed by RR)
+        re.compile(r'(^|\b)p:?\s*(\d+)(?!\s*rr)'),  # P: 72 (not followed by RR)
     ]
 
     # Blood glucose patterns
     GLUCOSE_PATTERNS = [
-        re.compile(r'(\d+)\s*(?:mg/dL|mg/dl|mgdL)', re.IGNORECASE),  # 120 mg/dL
-        re.compile(r'(?:mg/dL|mg/dl|mgdL)\s*(\d+)', re.IGNORECASE),  # mg/dL 120
-        re.compile(r'(\d+(?:\.\d+)?)\s*(?:mmol/L|mmol/l)', re.IGNORECASE),  # 6.7 mmol/L
-        re.compile(r'(?:mmol/L|mmol/l)\s*(\d+(?:\.\d+)?)', re.IGNORECASE),  # mmol/L 6.7
-        re.compile(r'BG:?\s*(\d+)\s*(?:mg/dL|mg/dl|mgdL)', re.IGNORECASE),  # BG: 120 mg/dL
-        re.compile(r'GLU:?\s*(\d+)\s*(?:mg/dL|mg/dl|mgdL)', re.IGNORECASE),  # GLU: 120 mg/dL
+        re.compile(r'(\d+)\s*(?:mg/dl|mgdl)'),  # 120 mg/dL
+        re.compile(r'(?:mg/dl|mgdl)\s*(\d+)'),  # mg/dL 120
+        re.compile(r'(\d+(?:\.\d+)?)\s*mmol/l'),  # 6.7 mmol/L
+        re.compile(r'mmol/l\s*(\d+(?:\.\d+)?)'),  # mmol/L 6.7
+        re.compile(r'bg:?\s*(\d+)\s*(?:mg/dl|mgdl)'),  # BG: 120 mg/dL
+        re.compile(r'glu:?\s*(\d+)\s*(?:mg/dl|mgdl)'),  # GLU: 120 mg/dL
     ]
 
     # Respiratory rate patterns
     RESP_RATE_PATTERNS = [
-        re.compile(r'(\d+)\s*RR', re.IGNORECASE),  # 16 RR
-        re.compile(r'RR:?\s*(\d+)', re.IGNORECASE),  # RR: 16
-        re.compile(r'RESP:?\s*(\d+)', re.IGNORECASE),  # RESP: 16
-        re.compile(r'(^|\b)R:?\s*(\d+)\b', re.IGNORECASE),  # R: 16 at start or word boundary
+        re.compile(r'(\d+)\s*rr'),  # 16 RR
+        re.compile(r'rr:?\s*(\d+)'),  # RR: 16
+        re.compile(r'resp:?\s*(\d+)'),  # RESP: 16
+        re.compile(r'(^|\b)r:?\s*(\d+)\b'),  # R: 16 at start or word boundary
     ]
 
     # Pain scale patterns
     PAIN_PATTERNS = [
-        re.compile(r'(-?\d+)\s*(?:/10|/ 10|out of 10)(?!\s*mmHg)', re.IGNORECASE),  # -1/10 (not followed by mmHg)
-        re.compile(r'PAIN:?\s*(-?\d+)\s*(?:/10|/ 10|out of 10)(?!\s*mmHg)', re.IGNORECASE),  # PAIN: -1/10
-        re.compile(r'P:?\s*(-?\d+)\s*(?:/10|/ 10|out of 10)(?!\s*mmHg)', re.IGNORECASE),  # P: -1/10
+        re.compile(r'(-?\d+)\s*(?:/10|/ 10|out of 10)(?!\s*mmhg)'),  # -1/10 (not followed by mmHg)
+        re.compile(r'pain:?\s*(-?\d+)\s*(?:/10|/ 10|out of 10)(?!\s*mmhg)'),  # PAIN: -1/10
+        re.compile(r'p:?\s*(-?\d+)\s*(?:/10|/ 10|out of 10)(?!\s*mmhg)'),  # P: -1/10
     ]
 
     # Height patterns
     HEIGHT_PATTERNS = [
-        re.compile(r'(\d+(?:\.\d+)?)\s*(?:cm|centimeters?)(?!\s*[FCfc])', re.IGNORECASE),  # 170 cm (not followed by F/C)
-        re.compile(r'(?:cm|centimeters?)(?!\s*[FCfc])\s*(\d+(?:\.\d+)?)', re.IGNORECASE),  # cm 170 (not followed by F/C)
-        re.compile(r'(\d+)\'?\s*(\d+)\s*(?:in|inches?)(?!\s*[FCfc])', re.IGNORECASE),  # 5'10 in (not followed by F/C)
-        re.compile(r'(\d+)\'?\s*(\d+)\"(?!\s*[FCfc])', re.IGNORECASE),  # 5'10" (not followed by F/C)
-        re.compile(r'H:?\s*(\d+(?:\.\d+)?)\s*(?:cm|centimeters?)(?!\s*[FCfc])', re.IGNORECASE),  # H: 170 cm
-        re.compile(r'HT:?\s*(\d+(?:\.\d+)?)\s*(?:cm|centimeters?)(?!\s*[FCfc])', re.IGNORECASE),  # HT: 170 cm
+        re.compile(r'(\d+(?:\.\d+)?)\s*(?:cm|centimeters?)(?!\s*[fc])'),  # 170 cm (not followed by F/C)
+        re.compile(r'(?:cm|centimeters?)(?!\s*[fc])\s*(\d+(?:\.\d+)?)'),  # cm 170 (not followed by F/C)
+        re.compile(r'(\d+)\'?\s*(\d+)\s*(?:in|inches?)(?!\s*[fc])'),  # 5'10 in (not followed by F/C)
+        re.compile(r'(\d+)\'?\s*(\d+)\"(?!\s*[fc])'),  # 5'10" (not followed by F/C)
+        re.compile(r'h:?\s*(\d+(?:\.\d+)?)\s*(?:cm|centimeters?)(?!\s*[fc])'),  # H: 170 cm
+        re.compile(r'ht:?\s*(\d+(?:\.\d+)?)\s*(?:cm|centimeters?)(?!\s*[fc])'),  # HT: 170 cm
     ]
 
-    def find_readings(self, text: str, confidence: float) -> List[MedicalReading]:
-        """Find all medical readings in the text."""
+    # Each type's patterns fused into one alternation; a single search tells
+    # whether any of them can match a line before the patterns are run one by one
+    PAIN_COMBINED = _combine_patterns(PAIN_PATTERNS)
+    HEIGHT_COMBINED = _combine_patterns(HEIGHT_PATTERNS)
+    TEMP_COMBINED = _combine_patterns(TEMP_PATTERNS)
+    WEIGHT_COMBINED = _combine_patterns(WEIGHT_PATTERNS)
+    BP_COMBINED = _combine_patterns(BP_PATTERNS)
+    OXYGEN_COMBINED = _combine_patterns(OXYGEN_PATTERNS)
+    HR_COMBINED = _combine_patterns(HR_PATTERNS)
+    RESP_RATE_COMBINED = _combine_patterns(RESP_RATE_PATTERNS)
+    GLUCOSE_COMBINED = _combine_patterns(GLUCOSE_PATTERNS)
+
+    # (patterns, combined gate, type) in the order find_readings tries them;
+    # built once here rather than per call and per line
+    _PAIN = (PAIN_PATTERNS, PAIN_COMBINED, ReadingType.PAIN_SCALE)
+    _HEART_RATE = (HR_PATTERNS, HR_COMBINED, ReadingType.HEART_RATE)
+    _RESP_RATE = (RESP_RATE_PATTERNS, RESP_RATE_COMBINED, ReadingType.RESPIRATORY_RATE)
+    _DEFAULT_READING_TYPES = (
+        _PAIN,
+        (HEIGHT_PATTERNS, HEIGHT_COMBINED, ReadingType.HEIGHT),
+        (TEMP_PATTERNS, TEMP_COMBINED, ReadingType.TEMPERATURE),
+        (WEIGHT_PATTERNS, WEIGHT_COMBINED, ReadingType.WEIGHT),
+        (BP_PATTERNS, BP_COMBINED, ReadingType.BLOOD_PRESSURE),
+        (OXYGEN_PATTERNS, OXYGEN_COMBINED, ReadingType.OXYGEN),
+        _HEART_RATE,
+        _RESP_RATE,
+        (GLUCOSE_PATTERNS, GLUCOSE_COMBINED, ReadingType.BLOOD_GLUCOSE),
+    )
+    # With hyperscan installed, one scan per ASCII line replaces the per-type gate searches
+    _HYPERSCAN_GATE = _HyperscanGate.build(_DEFAULT_READING_TYPES)
+    # Lines starting with R: or P: are only tried as one type
+    _RESP_RATE_ONLY = (_RESP_RATE,)
+    _PAIN_ONLY = (_PAIN,)
+    _HEART_RATE_ONLY = (_HEART_RATE,)
+
+    # All weight patterns as one alternation, for extract_weight's single pass
+    WEIGHT_SCANNER = re.compile('|'.join(f'(?:{pattern.pattern})' for pattern in WEIGHT_PATTERNS))
+
+    def find_readings(self, text: str, confidence: float,
+                      as_batch: bool = False) -> Union[List[MedicalReading], ReadingsBatch]:
+        """Find all medical readings in the text.
+
+        Results are memoized per text (OCR often yields the same text again);
+        MedicalReading is immutable, so the same reading objects are shared.
+
+        With as_batch=True the readings are returned as a ReadingsBatch.
+        """
+        readings = list(_cached_readings(type(self), text))
+        if as_batch:
+            return ReadingsBatch.from_readings(readings, confidence)
+        return readings
+
+    @classmethod
+    def _scan_readings(cls, text: str) -> Tuple[MedicalReading, ...]:
+        """Find readings in the text."""
+        # Every reading has a digit; most OCR text has none, so skip splitting it into lines
+        if not _DIGIT.search(text):
+            return ()
         readings = []
-        seen_patterns = set()  # Track which patterns have matched to avoid duplicates
+        add_reading = readings.append
         seen_readings = set()  # Track (type, value, unit) to avoid duplicate readings
         
-        # Normalize newlines to handle different line endings
-        text = text.replace('\r\n', '\n').replace('\r', '\n')
-        lines = text.split('\n')
+        # Split on any line ending (\n, \r\n, \r, and the form feed Tesseract ends pages with)
+        lines = text.splitlines()
         
-        # Default order
-        default_reading_types = [
-            (self.PAIN_PATTERNS, ReadingType.PAIN_SCALE, self._is_valid_pain_scale),
-            (self.HEIGHT_PATTERNS, ReadingType.HEIGHT, self._is_valid_height),
-            (self.TEMP_PATTERNS, ReadingType.TEMPERATURE, self._is_valid_temperature),
-            (self.WEIGHT_PATTERNS, ReadingType.WEIGHT, self._is_valid_weight),
-            (self.BP_PATTERNS, ReadingType.BLOOD_PRESSURE, self._is_valid_blood_pressure),
-            (self.OXYGEN_PATTERNS, ReadingType.OXYGEN, self._is_valid_oxygen),
-            (self.HR_PATTERNS, ReadingType.HEART_RATE, self._is_valid_heart_rate),
-            (self.RESP_RATE_PATTERNS, ReadingType.RESPIRATORY_RATE, self._is_valid_respiratory_rate),
-            (self.GLUCOSE_PATTERNS, ReadingType.BLOOD_GLUCOSE, self._is_valid_glucose),
-        ]
         for line in lines:
+            if not _DIGIT.search(line):
+                continue
             line_readings = set()
             all_matches = []
+            seen_spans = set()  # (start, end) of matches already taken on this line
+            line_lc = line.lower()
             # Special handling for lines starting with R: or P:
-            if re.match(r'^\s*R:', line, re.IGNORECASE):
-                reading_types = [
-                    (self.RESP_RATE_PATTERNS, ReadingType.RESPIRATORY_RATE, self._is_valid_respiratory_rate)
-                ]
-            elif re.match(r'^\s*P:', line, re.IGNORECASE):
+            prefix = line.lstrip()[:2].lower()
+            if prefix == 'r:':
+                reading_types = cls._RESP_RATE_ONLY
+            elif prefix == 'p:':
                 # If /10 or out of 10, only match as pain scale
-                if re.search(r'\d+\s*(/10|out of 10)', line, re.IGNORECASE):
-                    reading_types = [
-                        (self.PAIN_PATTERNS, ReadingType.PAIN_SCALE, self._is_valid_pain_scale)
-                    ]
+                if _OUT_OF_TEN.search(line):
+                    reading_types = cls._PAIN_ONLY
                 else:
-                    reading_types = [
-                        (self.HR_PATTERNS, ReadingType.HEART_RATE, self._is_valid_heart_rate)
-                    ]
+                    reading_types = cls._HEART_RATE_ONLY
             else:
-                reading_types = default_reading_types
-            for patterns, reading_type, validator in reading_types:
+                reading_types = cls._DEFAULT_READING_TYPES
+            gate = cls._HYPERSCAN_GATE
+            candidates = gate.scan(line) if gate is not None and line.isascii() else None
+            for patterns, combined, reading_type in reading_types:
+                # Most lines hold one reading, so most types are rejected by this one scan
+                subject = line if reading_type in _CASE_SENSITIVE_TYPES else line_lc
+                if candidates is not None:
+                    if reading_type not in candidates:
+                        continue
+                elif not combined.search(subject):
+                    continue
                 for pattern in patterns:
-                    for match in pattern.finditer(line):
-                        if match.group(0) not in seen_patterns:
-                            seen_patterns.add(match.group(0))
-                            all_matches.append((match, reading_type, validator))
-            for match, reading_type, validator in all_matches:
-                if reading_type == ReadingType.HEIGHT and 'cm' not in match.group(0).lower():
-                    feet = int(match.group(1))
-                    inches = int(match.group(2))
-                    value = feet * 12 + inches
-                    unit = 'in'
-                else:
-                    # For HR/RESP patterns, group(2) is the value for R: and P: patterns
-                    if reading_type in [ReadingType.HEART_RATE, ReadingType.RESPIRATORY_RATE] and match.lastindex == 2:
-                        value = float(match.group(2))
-                    else:
-                        value = float(match.group(1))
-                    if reading_type == ReadingType.TEMPERATURE:
-                        unit = 'F' if 'f' in match.group(0).lower() else 'C'
-                    elif reading_type == ReadingType.WEIGHT:
-                        unit = 'kg' if 'kg' in match.group(0).lower() else 'lb'
-                    elif reading_type == ReadingType.BLOOD_GLUCOSE:
-                        unit = 'mmol/L' if 'mmol' in match.group(0).lower() else 'mg/dL'
-                    elif reading_type == ReadingType.BLOOD_PRESSURE:
-                        systolic = int(match.group(1))
-                        diastolic = int(match.group(2))
-                        value = systolic
-                        unit = f"{systolic}/{diastolic} mmHg"
-                    elif reading_type == ReadingType.RESPIRATORY_RATE:
-                        unit = 'breaths/min'
-                    elif reading_type == ReadingType.HEART_RATE:
-                        unit = 'BPM'
-                    elif reading_type == ReadingType.PAIN_SCALE:
-                        unit = '/10'
-                    else:
-                        unit = self._get_unit_for_type(reading_type)
-                # Call validator with correct number of arguments
-                if reading_type == ReadingType.BLOOD_PRESSURE:
-                    is_valid = validator(systolic, diastolic)
-                elif reading_type in [ReadingType.OXYGEN, ReadingType.HEART_RATE, 
-                                    ReadingType.RESPIRATORY_RATE, ReadingType.PAIN_SCALE]:
-                    is_valid = validator(value)
-                else:
-                    is_valid = validator(value, unit)
+                    for match in pattern.finditer(subject):
+                        span = match.span()
+                        if span not in seen_spans:
+                            seen_spans.add(span)
+                            all_matches.append((match, reading_type))
+            for match, reading_type in all_matches:
+                # Only the first new reading of each type on a line is kept
+                if reading_type in line_readings:
+                    continue
+                value, unit = _PARSERS[reading_type](match)
                 reading_key = (reading_type, value, unit)
-                if reading_key in seen_readings or reading_type in line_readings:
+                if reading_key in seen_readings:
                     continue
+                if reading_type is ReadingType.BLOOD_PRESSURE:
+                    systolic, diastolic = unit
+                    sys_lo, sys_hi = _VALID_RANGES[_SYSTOLIC_KEY]
+                    dia_lo, dia_hi = _VALID_RANGES[_DIASTOLIC_KEY]
+                    is_valid = sys_lo <= systolic <= sys_hi and dia_lo <= diastolic <= dia_hi
+                    unit = f"{systolic}/{diastolic} mmHg"
+                else:
+                    lo, hi = _VALID_RANGES[(reading_type, unit)]
+                    is_valid = lo <= value <= hi
                 seen_readings.add(reading_key)
                 line_readings.add(reading_type)
-                readings.append(MedicalReading(
-                    type=reading_type,
-                    value=value,
-                    unit=unit,
-                    is_valid=is_valid
-                ))
-        return readings
-
-    def _is_valid_temperature(self, value: float, unit: str) -> bool:
-        """Check if temperature is within normal range."""
-        if unit == 'F':
-            return 95.0 <= value <= 104.0
-        else:  # Celsius
-            return 35.0 <= value <= 40.0
-
-    def _is_valid_weight(self, value: float, unit: str) -> bool:
-        """Check if weight is within normal range."""
-        if unit == 'kg':
-            return 20.0 <= value <= 200.0
-        else:  # pounds
-            return 44.0 <= value <= 440.0
-
-    def _is_valid_blood_pressure(self, systolic: int, diastolic: int) -> bool:
-        """Check if blood pressure is within normal range."""
-        return (90 <= systolic <= 140) and (60 <= diastolic <= 90)
-
-    def _is_valid_oxygen(self, value: float) -> bool:
-        """Check if oxygen saturation is within normal range."""
-        return 70 <= value <= 100
-
-    def _is_valid_heart_rate(self, value: float) -> bool:
-        """Check if heart rate is within normal range."""
-        return 40 <= value <= 200
-
-    def _is_valid_glucose(self, value: float, unit: str) -> bool:
-        """Check if blood glucose is within normal range."""
-        if unit == 'mmol/L':
-            return 2.8 <= value <= 22.2
-        else:  # mg/dL
-            return 50 <= value <= 400
-
-    def _is_valid_respiratory_rate(self, value: float) -> bool:
-        """Check if respiratory rate is within normal range."""
-        return 8 <= value <= 40
-
-    def _is_valid_pain_scale(self, value: float) -> bool:
-        """Check if pain scale value is valid."""
-        return 0 <= value <= 10
-
-    def _is_valid_height(self, value: float, unit: str) -> bool:
-        """Check if height is within normal range."""
-        if unit == 'cm':
-            return 30.0 <= value <= 250.0
-        else:  # inches
-            return 12.0 <= value <= 100.0
+                add_reading(MedicalReading(reading_type, value, unit, is_valid))
+        return tuple(readings)
+
+    def find_readings_batch(self, texts: List[str], confidences: List[float],
+                            max_workers: Optional[int] = None,
+                            as_batch: bool = False) -> Union[List[List[MedicalReading]], ReadingsBatch]:
+        """Find readings in many OCR texts, e.g. one per page.
+
+        Large batches are spread over a process pool. The patterns are class
+        attributes, so each worker compiles them once on import and only the
+        matcher class, texts and readings cross process boundaries; a
+        subclass must be importable by the workers to be sent this way.
+
+        Args:
+            texts: OCR texts to search
+            confidences: OCR confidence for each text
+            max_workers: Number of worker processes (defaults to the CPU count);
+                1 searches the batch in the calling process
+            as_batch: Return every reading in one ReadingsBatch, each tagged
+                with the confidence of the text it came from
+
+        Returns:
+            Readings for each text, in input order, or a single ReadingsBatch
+        """
+        workers = max_workers or os.cpu_count() or 1
+        if workers > 1 and len(texts) >= _PARALLEL_MIN_BATCH:
+            chunksize = max(1, len(texts) // (4 * workers))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_find_readings, itertools.repeat(type(self)), texts, confidences,
+                                            chunksize=chunksize))
+        else:
+            results = [self.find_readings(text, confidence) for text, confidence in zip(texts, confidences)]
+        if as_batch:
+            return ReadingsBatch.concat([
+                ReadingsBatch.from_readings(readings, confidence)
+                for readings, confidence in zip(results, confidences)
+            ])
+        return results
 
     def validate_temperature_format(self, text: str) -> ValidationResult:
         """Validate temperature format and return validation result."""
-        # Check for invalid characters
-        if '/' in text or '\\' in text:
-            return ValidationResult(
-                is_valid=False,
-                confidence_adjustment=-20.0,
-                error_reason="Invalid character '/' or '\\' in temperature",
-                suggested_correction=text.replace('/', '.').replace('\\', '.')
-            )
-
-        # Check for trailing decimal point
-        if text.endswith('.'):
-            return ValidationResult(
-                is_valid=False,
-                confidence_adjustment=-15.0,  # -15.0 for trailing decimal
-                error_reason="Temperature ends with decimal point",
-                suggested_correction=text.rstrip('.')
-            )
-
-        # Check for missing unit
-        if not any(unit in text.lower() for unit in ['f', 'c', '°f', '°c']):
-            return ValidationResult(
-                is_valid=False,
-                confidence_adjustment=-25.0,  # -25.0 for missing unit
-                error_reason="Missing temperature unit (F or C)",
-                suggested_correction=text + '°F'
-            )
-
-        # Check for valid format with units in different positions
-        valid_formats = [
-            r'^\d+(\.\d+)?\s*[°]?[FCfc]$',  # 98.6F
-            r'^[°]?[FCfc]\s*\d+(\.\d+)?$',  # F98.6
-            r'^\d+(\.\d+)?\s*[°]?[FCfc]\s*$',  # 98.6F at end
-            r'^[°]?[FCfc]\s*\d+(\.\d+)?$',  # F98.6 at start
-        ]
-        
-        if not any(re.match(pattern, text.strip()) for pattern in valid_formats):
-            return ValidationResult(
-                is_valid=False,
-                confidence_adjustment=-30.0,
-                error_reason="Invalid temperature format",
-                suggested_correction=None
-            )
-
-        return ValidationResult(is_valid=True, confidence_adjustment=0.0)
+        return _check_temperature_format(text)
 
     def validate_digits_with_confidence(self, word_data: List[Dict[str, Any]], text: str) -> Tuple[str, List[str]]:
         """Validate digits with confidence and return validated text and issues."""
@@ -325,35 +566,97 @@ class PatternMatcher:
 
         return validated_text, issues
 
-    def extract_weight(self, text: str, confidence: float) -> List[Dict[str, Any]]:
-        """Extract weight readings from text."""
+    def extract_weight(self, text: str, confidence: float,
+                       as_batch: bool = False) -> Union[List[MedicalReading], ReadingsBatch]:
+        """Extract weight readings from text.
+
+        The weight patterns run as one alternation, so a stretch of text is
+        claimed by at most one reading (the "lb 70" in "150lb 70kg" is not
+        read as a second pound value). Units are reported as 'lbs' or 'kg'.
+
+        Args:
+            text: Text to search, possibly spanning several lines
+            confidence: OCR confidence for the text (not used for filtering)
+            as_batch: Return the readings as a ReadingsBatch
+
+        Returns:
+            List[MedicalReading]: One weight reading per distinct matched text,
+                or a ReadingsBatch of them with as_batch=True
+        """
         readings = []
         seen_raw_texts = set()  # Track raw texts to avoid duplicates
 
-        for pattern in self.WEIGHT_PATTERNS:
-            for match in pattern.finditer(text):
-                raw_text = match.group(0)
-                if raw_text in seen_raw_texts:
-                    continue
-                seen_raw_texts.add(raw_text)
-                value = float(match.group(1))
-                unit = match.group(2).lower()
-                readings.append({
-                    'value': value,
-                    'unit': unit,
-                    'raw_text': raw_text,
-                    'conf': confidence
-                })
-
+        for match in self.WEIGHT_SCANNER.finditer(text.lower()):
+            raw_text = match.group(0)
+            if raw_text in seen_raw_texts:
+                continue
+            seen_raw_texts.add(raw_text)
+            # Every alternative captures only the value, so it is the last group set
+            value = float(match.group(match.lastindex))
+            unit = _weight_unit(raw_text)
+            lo, hi = _VALID_RANGES[(ReadingType.WEIGHT, unit)]
+            readings.append(MedicalReading(
+                type=ReadingType.WEIGHT,
+                value=value,
+                unit='lbs' if unit == 'lb' else unit,
+                is_valid=lo <= value <= hi
+            ))
+
+        if as_batch:
+            return ReadingsBatch.from_readings(readings, confidence)
         return readings
 
     def _get_unit_for_type(self, reading_type: ReadingType) -> str:
         """Get the default unit for a reading type."""
-        unit_map = {
-            ReadingType.OXYGEN: '%',
-            ReadingType.HEART_RATE: 'BPM',
-            ReadingType.RESPIRATORY_RATE: 'breaths/min',
-            ReadingType.PAIN_SCALE: '/10',
-            ReadingType.HEIGHT: 'cm',  # Added default unit for height
-        }
-        return unit_map.get(reading_type, '') 
\ No newline at end of file
+        return _DEFAULT_UNITS.get(reading_type, '')
+
+def _find_readings(matcher_cls: type, text: str, confidence: float) -> List[MedicalReading]:
+    """Run matcher_cls().find_readings on one text; module-level so it can run in a worker process."""
+    return matcher_cls().find_readings(text, confidence)
+
+@functools.lru_cache(maxsize=_READINGS_CACHE_SIZE)
+def _cached_readings(matcher_cls: type, text: str) -> Tuple[MedicalReading, ...]:
+    """Memoized PatternMatcher._scan_readings; keyed by class so subclasses' patterns apply."""
+    return matcher_cls._scan_readings(text)
+
+@functools.lru_cache(maxsize=_READINGS_CACHE_SIZE)
+def _check_temperature_format(text: str) -> ValidationResult:
+    """Validate a temperature string (memoized body of validate_temperature_format)."""
+    # Check for invalid characters
+    if '/' in text or '\\' in text:
+        return ValidationResult(
+            is_valid=False,
+            confidence_adjustment=-20.0,
+            error_reason="Invalid character '/' or '\\' in temperature",
+            suggested_correction=text.replace('/', '.').replace('\\', '.')
+        )
+
+    # Check for trailing decimal point
+    if text.endswith('.'):
+        return ValidationResult(
+            is_valid=False,
+            confidence_adjustment=-15.0,  # -15.0 for trailing decimal
+            error_reason="Temperature ends with decimal point",
+            suggested_correction=text.rstrip('.')
+        )
+
+    # Check for missing unit ('°f' and '°c' contain 'f' and 'c')
+    text_lc = text.lower()
+    if 'f' not in text_lc and 'c' not in text_lc:
+        return ValidationResult(
+            is_valid=False,
+            confidence_adjustment=-25.0,  # -25.0 for missing unit
+            error_reason="Missing temperature unit (F or C)",
+            suggested_correction=text + '°F'
+        )
+
+    # Check for valid format with units in different positions
+    if not _TEMP_FORMAT.fullmatch(text.strip()):
+        return ValidationResult(
+            is_valid=False,
+            confidence_adjustment=-30.0,
+            error_reason="Invalid temperature format",
+            suggested_correction=None
+        )
+
+    return ValidationResult(is_valid=True, confidence_adjustment=0.0)
@@ -1,10 +1,62 @@
+import contextlib
+import operator
+
 import cv2
 import numpy as np
-from typing import List, Tuple, Optional
-from dataclasses import dataclass
+from typing import List, NamedTuple, Tuple, Optional
+
+# Sort key for ranking regions
+_BY_CONFIDENCE = operator.attrgetter('confidence')
+
+# draw_regions colors (BGR) for LCD and other display regions
+_LCD_COLOR = (0, 255, 0)
+_REGION_COLOR = (0, 0, 255)
 
-@dataclass
-class DisplayRegion:
+# Larger regions are subsampled to about this many pixels for the LCD histogram
+_LCD_SAMPLE_PIXELS = 16384
+
+def _bounding_rects(contours) -> np.ndarray:
+    """
+    Bounding rectangles of all contours, as cv2.boundingRect would give them.
+    
+    Args:
+        contours: Contours from cv2.findContours
+        
+    Returns:
+        np.ndarray: One (x, y, w, h) row per contour
+    """
+    if not contours:
+        return np.empty((0, 4), dtype=np.int64)
+    # Min/max over each contour's slice of the concatenated points
+    points = np.concatenate(contours).reshape(-1, 2).astype(np.int64)
+    lengths = np.fromiter(map(len, contours), dtype=np.intp, count=len(contours))
+    starts = np.concatenate(([0], np.cumsum(lengths[:-1])))
+    top_left = np.minimum.reduceat(points, starts)
+    bottom_right = np.maximum.reduceat(points, starts)
+    return np.hstack((top_left, bottom_right - top_left + 1))
+
+@contextlib.contextmanager
+def _opencv_threads(num_threads: Optional[int]):
+    """
+    Set OpenCV's thread count for the duration of a block, then restore it.
+    
+    The setting is process-wide, so it also applies to OpenCV calls made by
+    other threads while the block runs.
+    
+    Args:
+        num_threads: Thread count for cv2.setNumThreads; None leaves it unchanged
+    """
+    if num_threads is None:
+        yield
+        return
+    previous = cv2.getNumThreads()
+    cv2.setNumThreads(num_threads)
+    try:
+        yield
+    finally:
+        cv2.setNumThreads(previous)
+
+class DisplayRegion(NamedTuple):
     """Class to hold information about a detected display region."""
     x: int
     y: int
@@ -19,7 +71,9 @@ class ROIDetector:
     def __init__(self, 
                  min_area: int = 500,
                  max_area: int = 300000,
-                 aspect_ratio_range: Tuple[float, float] = (0.2, 4.0)):
+                 aspect_ratio_range: Tuple[float, float] = (0.2, 4.0),
+                 max_detection_size: int = 800,
+                 num_threads: Optional[int] = None):
         """
         Initialize ROI detector with configuration parameters.
         
@@ -27,30 +81,55 @@ class ROIDetector:
             min_area: Minimum area for a valid display region
             max_area: Maximum area for a valid display region
             aspect_ratio_range: Valid range for width/height ratio
+            max_detection_size: Larger images are halved (cv2.pyrDown) until
+                their longest side fits, before thresholding and contour search
+            num_threads: If set, OpenCV's thread count while detect_displays runs
+                (restored afterwards); use 1 when detectors run in a process pool
+                to avoid oversubscription
         """
         self.min_area = min_area
         self.max_area = max_area
         self.aspect_ratio_range = aspect_ratio_range
+        self.max_detection_size = max_detection_size
+        self.num_threads = num_threads
     
     def detect_displays(self, image: np.ndarray) -> List[DisplayRegion]:
         """
         Detect display regions in the image.
         
         Args:
-            image: Input image (BGR format)
+            image: Input image (BGR or single-channel grayscale)
             
         Returns:
             List[DisplayRegion]: List of detected display regions
         """
+        with _opencv_threads(self.num_threads):
+            return self._detect_displays(image)
+    
+    def _detect_displays(self, image: np.ndarray) -> List[DisplayRegion]:
+        """Body of detect_displays, run with the configured OpenCV thread count."""
         # Handle empty or invalid images
         if image is None or image.size == 0:
             return []
             
-        # Convert to grayscale
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        # Convert to grayscale (single-channel frames are used as they are)
+        if image.ndim == 2:
+            gray = image
+        elif image.shape[2] == 1:
+            gray = image[:, :, 0]
+        else:
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        
+        # Search for contours on a downscaled copy of large frames; contour
+        # search cost grows with the pixel count
+        small = gray
+        scale = 1
+        while max(small.shape[:2]) > self.max_detection_size:
+            small = cv2.pyrDown(small)
+            scale *= 2
         
         # Apply Gaussian blur to reduce noise
-        blurred = cv2.GaussianBlur(gray, (5, 5), 0)
+        blurred = cv2.GaussianBlur(small, (5, 5), 0)
         
         # Apply adaptive thresholding
         thresh = cv2.adaptiveThreshold(
@@ -63,58 +142,64 @@ class ROIDetector:
             thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
         )
         
-        # Filter and process contours
+        # Filter all bounding rectangles at once, in full-resolution coordinates
+        rects = _bounding_rects(contours) * scale
+        xs, ys, ws, hs = rects.T
+        if scale > 1:
+            # pyrDown rounds odd sizes up, so keep scaled boxes inside the frame
+            ws = np.minimum(ws, gray.shape[1] - xs)
+            hs = np.minimum(hs, gray.shape[0] - ys)
+        areas = ws * hs
+        aspect_ratios = ws / np.maximum(hs, 1)
+        keep = ((areas >= self.min_area) & (areas <= self.max_area) &
+                (aspect_ratios >= self.aspect_ratio_range[0]) &
+                (aspect_ratios <= self.aspect_ratio_range[1]))
+        
+        # Score the regions that meet the criteria
         display_regions = []
-        for contour in contours:
-            # Get bounding rectangle
-            x, y, w, h = cv2.boundingRect(contour)
+        for i in np.flatnonzero(keep).tolist():
+            x, y, w, h = int(xs[i]), int(ys[i]), int(ws[i]), int(hs[i])
             area = w * h
-            aspect_ratio = w / h if h > 0 else 0
             
-            # Check if region meets criteria
-            if (self.min_area <= area <= self.max_area and
-                self.aspect_ratio_range[0] <= aspect_ratio <= self.aspect_ratio_range[1]):
-                
-                # Calculate confidence based on shape regularity
-                confidence = self._calculate_confidence(contour, area)
-                
-                # Check if region looks like an LCD display
-                is_lcd = self._is_lcd_display(gray[y:y+h, x:x+w])
-                
-                display_regions.append(DisplayRegion(
-                    x=x, y=y, width=w, height=h,
-                    confidence=confidence,
-                    is_lcd=is_lcd
-                ))
+            # Calculate confidence based on shape regularity
+            confidence = self._calculate_confidence(contours[i], area, scale)
+            
+            # Check if region looks like an LCD display
+            is_lcd = self._is_lcd_display(gray[y:y+h, x:x+w])
+            
+            display_regions.append(DisplayRegion(
+                x=x, y=y, width=w, height=h,
+                confidence=confidence,
+                is_lcd=is_lcd
+            ))
         
         # Sort regions by confidence
-        display_regions.sort(key=lambda r: r.confidence, reverse=True)
+        display_regions.sort(key=_BY_CONFIDENCE, reverse=True)
         
         return display_regions
     
-    def _calculate_confidence(self, contour: np.ndarray, area: int) -> float:
+    def _calculate_confidence(self, contour: np.ndarray, area: int, scale: int = 1) -> float:
         """
         Calculate confidence score for a detected region.
         
         Args:
             contour: Region contour
-            area: Region area
+            area: Bounding-box area of the region (full-resolution pixels)
+            scale: Factor from contour coordinates to full resolution
             
         Returns:
             float: Confidence score (0-100)
         """
         # Calculate contour properties
-        perimeter = cv2.arcLength(contour, True)
+        perimeter = cv2.arcLength(contour, True) * scale
         if perimeter == 0:
             return 0.0
             
         # Calculate shape regularity
         circularity = 4 * np.pi * area / (perimeter * perimeter)
         
-        # Calculate rectangularity
-        x, y, w, h = cv2.boundingRect(contour)
-        rect_area = w * h
-        rectangularity = area / rect_area if rect_area > 0 else 0
+        # area is the bounding box's own, so rectangularity (area / box area) is always 1
+        rectangularity = 1.0
         
         # Combine metrics into confidence score
         confidence = (circularity * 0.3 + rectangularity * 0.7) * 100
@@ -133,38 +218,57 @@ class ROIDetector:
         if region.size == 0:
             return False
         
-        # Calculate histogram
-        hist = cv2.calcHist([region], [0], None, [256], [0, 256])
-        hist = hist.flatten() / hist.sum()
+        # Every k-th pixel of every k-th row keeps the grey-level distribution
+        # (averaging, as in INTER_AREA resizing, would smooth away noise levels)
+        step = int(np.sqrt(region.size / _LCD_SAMPLE_PIXELS))
+        if step > 1:
+            region = region[::step, ::step]
         
-        # Even more lenient criteria for LCD detection
-        distinct_values = np.count_nonzero(hist > 0.005)  # Count significant peaks
-        contrast = np.std(region) / 128.0  # Normalized contrast
-        mean_intensity = np.mean(region)
+        # LCDs are often mid-gray and high contrast; one meanStdDev call rules
+        # out most regions before the histogram is built
+        mean, stddev = cv2.meanStdDev(region)
+        mean_intensity = float(mean[0, 0])
+        contrast = float(stddev[0, 0]) / 128.0  # Normalized contrast
+        if not (contrast > 0.12 and 80 < mean_intensity < 220):
+            return False
         
-        # LCDs are often mid-gray, high contrast, not too many distinct values
-        return (distinct_values <= 40 and contrast > 0.12 and 80 < mean_intensity < 220)
+        # Even more lenient criteria for LCD detection: not too many distinct values
+        hist = cv2.calcHist([region], [0], None, [256], [0, 256]).ravel()
+        distinct_values = np.count_nonzero(hist > 0.005 * region.size)  # Count significant peaks
+        return distinct_values <= 40
     
-    def draw_regions(self, image: np.ndarray, regions: List[DisplayRegion]) -> np.ndarray:
+    def draw_regions(self, image: np.ndarray, regions: List[DisplayRegion],
+                     max_size: Optional[int] = None) -> np.ndarray:
         """
         Draw detected regions on the image for visualization.
         
         Args:
             image: Original image
             regions: List of detected regions
+            max_size: If set, draw on a copy halved (cv2.pyrDown) until its
+                longest side fits, e.g. for an on-screen preview
             
         Returns:
             np.ndarray: Image with regions drawn
         """
-        result = image.copy()
+        # Downscaling already yields a new image; otherwise copy the original
+        result = image
+        scale = 1
+        while max_size is not None and max(result.shape[:2]) > max_size:
+            result = cv2.pyrDown(result)
+            scale *= 2
+        if scale == 1:
+            result = image.copy()
         
         for region in regions:
+            x, y = region.x // scale, region.y // scale
+            
             # Draw rectangle
-            color = (0, 255, 0) if region.is_lcd else (0, 0, 255)
+            color = _LCD_COLOR if region.is_lcd else _REGION_COLOR
             cv2.rectangle(
                 result,
-                (region.x, region.y),
-                (region.x + region.width, region.y + region.height),
+                (x, y),
+                ((region.x + region.width) // scale, (region.y + region.height) // scale),
                 color,
                 2
             )
@@ -173,11 +277,11 @@ class ROIDetector:
             cv2.putText(
                 result,
                 f"{region.confidence:.1f}%",
-                (region.x, region.y - 5),
+                (x, y - 5),
                 cv2.FONT_HERSHEY_SIMPLEX,
                 0.5,
                 color,
                 1
             )
         
-        return result 
\ No newline at end of file
+        return result
@@ -1,4 +1,8 @@
-from typing import List, Dict, NamedTuple, Optional, Tuple
+from typing import List, Dict, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from .word_data import WordData
 
 ValidationIssue = NamedTuple('ValidationIssue', [
     ('original_char', Optional[str]),
@@ -9,53 +13,90 @@ ValidationIssue = NamedTuple('ValidationIssue', [
     ('context_type', str)
 ])
 
+# Digits OCR most often confuses with each other; one set lookup per character
+# keeps the scan cost flat as digits are added
+_CONFUSABLE_DIGITS = frozenset('35')
+
+def _append_low_confidence_issues(issues: List[ValidationIssue], word_text: str, word_conf: float) -> None:
+    """Add an issue for each confusable digit in a low-confidence word."""
+    for char_idx, char_in_word in enumerate(word_text):
+        if char_in_word not in _CONFUSABLE_DIGITS:
+            continue
+        issue = ValidationIssue(
+            original_char=char_in_word,
+            char_index_in_word=char_idx,
+            word_text=word_text,
+            word_confidence=word_conf,
+            message=f"Low confidence for digit '{char_in_word}' in word '{word_text}'",
+            context_type='confidence_check'
+        )
+        issues.append(issue)
+
 class Validator:
     LOW_CONFIDENCE_THRESHOLD_3_5 = 85.0 # Placeholder
 
     @classmethod
-    def validate_digits_with_confidence(cls, word_data: List[Dict], original_text: str, context: Optional[str] = None) -> Tuple[str, List[ValidationIssue]]:
+    def validate_digits_with_confidence(cls, word_data: Union[List[Dict], WordData], original_text: str, context: Optional[str] = None) -> Tuple[str, List[ValidationIssue]]:
+        # word_data is either a list of word dicts (OCREngine.extract_detailed_data)
+        # or a WordData of parallel arrays (OCREngine.extract_word_arrays)
+        # Only temperature context adds a range check; other calls run the
+        # confidence check alone
+        if context == "temperature_fahrenheit":
+            return original_text, cls._validate_temperature_fahrenheit(word_data)
+        return original_text, cls._validate_low_confidence(word_data)
+
+    @classmethod
+    def _validate_low_confidence(cls, word_data: Union[List[Dict], WordData]) -> List[ValidationIssue]:
         issues: List[ValidationIssue] = []
+        threshold = cls.LOW_CONFIDENCE_THRESHOLD_3_5
+
+        if isinstance(word_data, WordData):
+            # One vectorised comparison finds the few low-confidence words
+            for i in np.flatnonzero(word_data.conf < threshold).tolist():
+                _append_low_confidence_issues(issues, word_data.text[i], float(word_data.conf[i]))
+            return issues
 
         for word_info in word_data:
-            word_text = word_info['text']
             word_conf = float(word_info['conf']) # Ensure confidence is float
+            # The confidence is per word, so confident words skip the character scan entirely
+            if word_conf < threshold:
+                _append_low_confidence_issues(issues, word_info['text'], word_conf)
+
+        return issues
+
+    @classmethod
+    def _validate_temperature_fahrenheit(cls, word_data: Union[List[Dict], WordData]) -> List[ValidationIssue]:
+        issues: List[ValidationIssue] = []
+        threshold = cls.LOW_CONFIDENCE_THRESHOLD_3_5
+
+        if isinstance(word_data, WordData):
+            words = zip(word_data.text, word_data.conf.tolist())
+        else:
+            # Ensure confidence is float
+            words = ((word_info['text'], float(word_info['conf'])) for word_info in word_data)
+
+        for word_text, word_conf in words:
 
             # 1. Low confidence digit check
-            for char_idx, char_in_word in enumerate(word_text):
-              feature/pattern-matcher-enhancements
-                if (char_in_word == '3' or char_in_word == '5') and word_conf <= cls.LOW_CONFIDENCE_THRESHOLD_3_5:
-                if (char_in_word == '3' or char_in_word == '5') and word_conf < cls.LOW_CONFIDENCE_THRESHOLD_3_5:
-        main
+            if word_conf < threshold:
+                _append_low_confidence_issues(issues, word_text, word_conf)
+
+            # 2. Medical Range Checking (Basic Example)
+            try:
+                float_value = float(word_text)
+                # Simplistic range, can be expanded or made configurable
+                if float_value > 110.0 or float_value < 90.0:
                     issue = ValidationIssue(
-                        original_char=char_in_word,
-                        char_index_in_word=char_idx,
+                        original_char=None, # Not specific to a char
+                        char_index_in_word=-1, # Not specific to a char index
                         word_text=word_text,
                         word_confidence=word_conf,
-                        message=f"Low confidence for digit '{char_in_word}' in word '{word_text}'",
-                        context_type='confidence_check'
+                        message=f"Potential out-of-range temperature: {word_text}F",
+                        context_type='range_check'
                     )
                     issues.append(issue)
+            except ValueError:
+                # Word is not a number, ignore for range check
+                pass
 
-            # 2. Medical Range Checking (Basic Example)
-            if context == "temperature_fahrenheit":
-                try:
-                    float_value = float(word_text)
-                    # Simplistic range, can be expanded or made configurable
-                    if float_value > 110.0 or float_value < 90.0:
-                        issue = ValidationIssue(
-                            original_char=None, # Not specific to a char
-                            char_index_in_word=-1, # Not specific to a char index
-                            word_text=word_text,
-                            word_confidence=word_conf,
-                            message=f"Potential out-of-range temperature: {word_text}F",
-                            context_type='range_check'
-                        )
-                        issues.append(issue)
-                except ValueError:
-                    # Word is not a number, ignore for range check
-                    pass
-
-                  feature/pattern-matcher-enhancements
-        return original_text, issues
-        return original_text, issues
-      main
+        return issues
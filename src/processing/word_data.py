@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+
+@dataclass
+class WordData:
+    """Recognised words stored as parallel arrays; entry i of each field is word i."""
+    text: List[str]
+    conf: np.ndarray
+    left: np.ndarray
+    top: np.ndarray
+    width: np.ndarray
+    height: np.ndarray
+
+    @classmethod
+    def empty(cls) -> 'WordData':
+        """A WordData holding no words."""
+        no_ints = np.empty(0, dtype=np.int32)
+        return cls(text=[], conf=np.empty(0, dtype=np.float64),
+                   left=no_ints, top=no_ints, width=no_ints, height=no_ints)
+
+    def __len__(self) -> int:
+        return len(self.text)
@@ -2,6 +2,8 @@ import cv2
 import numpy as np
 import os
 import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple
 
 FONT = cv2.FONT_HERSHEY_SIMPLEX
 IMG_WIDTH = 300
@@ -14,11 +16,18 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 WEIGHT_UNITS = ["lb", "lbs", "kg", "kgs"]
 
+# Each image takes about 2 ms to render and save; below this many jobs a
+# process pool costs more to start than it saves
+_PARALLEL_MIN_JOBS = 500
 
-def generate_weight_image(weight: float, unit: str, filename: str):
-    img = np.full((IMG_HEIGHT, IMG_WIDTH, 3), BG_COLOR, dtype=np.uint8)
-    text = f"{weight}{unit}"
-    font_scale = 2.2 if len(str(int(weight))) < 3 else 1.8
+
+def _write_text_image(text: str, font_scale: float, filename: str, canvas: Optional[np.ndarray] = None):
+    """Draw text centered on a blank image and save it to OUTPUT_DIR.
+
+    A canvas passed in is cleared and reused instead of allocating a new image.
+    """
+    img = canvas if canvas is not None else np.empty((IMG_HEIGHT, IMG_WIDTH, 3), dtype=np.uint8)
+    img[:] = BG_COLOR
     thickness = 4
     (text_width, text_height), _ = cv2.getTextSize(text, FONT, font_scale, thickness)
     x = (IMG_WIDTH - text_width) // 2
@@ -27,8 +36,24 @@ def generate_weight_image(weight: float, unit: str, filename: str):
     cv2.imwrite(os.path.join(OUTPUT_DIR, filename), img)
 
 
-def main():
-    # Generate valid weights
+def _weight_font_scale(weight: float) -> float:
+    return 2.2 if len(str(int(weight))) < 3 else 1.8
+
+
+def generate_weight_image(weight: float, unit: str, filename: str, canvas: Optional[np.ndarray] = None):
+    _write_text_image(f"{weight}{unit}", _weight_font_scale(weight), filename, canvas)
+
+
+def _write_job(job: Tuple[str, float, str]):
+    """Process-pool entry point: render one (text, font_scale, filename) job."""
+    _write_text_image(*job)
+
+
+def main(max_workers: Optional[int] = None):
+    jobs = []
+
+    # Generate valid weights (drawn here so the random sequence does not
+    # depend on how the jobs are spread over processes)
     for i in range(30):
         unit = random.choice(WEIGHT_UNITS)
         if "kg" in unit:
@@ -36,7 +61,7 @@ def main():
         else:
             weight = round(random.uniform(50, 500), 1)
         filename = f"valid_{i}_{weight}{unit}.png"
-        generate_weight_image(weight, unit, filename)
+        jobs.append((f"{weight}{unit}", _weight_font_scale(weight), filename))
 
     # Generate invalid weights (too low, too high, malformed)
     invalid_cases = [
@@ -49,15 +74,18 @@ def main():
         ("123.", "invalid_trailingdot.png"),
         (".kg", "invalid_leadingdot.png"),
     ]
-    for text, filename in invalid_cases:
-        img = np.full((IMG_HEIGHT, IMG_WIDTH, 3), BG_COLOR, dtype=np.uint8)
-        font_scale = 2.0
-        thickness = 4
-        (text_width, text_height), _ = cv2.getTextSize(text, FONT, font_scale, thickness)
-        x = (IMG_WIDTH - text_width) // 2
-        y = (IMG_HEIGHT + text_height) // 2
-        cv2.putText(img, text, (x, y), FONT, font_scale, TEXT_COLOR, thickness, cv2.LINE_AA)
-        cv2.imwrite(os.path.join(OUTPUT_DIR, filename), img)
+    jobs.extend((text, 2.0, filename) for text, filename in invalid_cases)
+
+    # The images are independent, so large runs are spread over worker processes
+    workers = max_workers or os.cpu_count() or 1
+    if workers > 1 and len(jobs) >= _PARALLEL_MIN_JOBS:
+        chunksize = max(1, len(jobs) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_write_job, jobs, chunksize=chunksize))
+    else:
+        canvas = np.empty((IMG_HEIGHT, IMG_WIDTH, 3), dtype=np.uint8)
+        for text, font_scale, filename in jobs:
+            _write_text_image(text, font_scale, filename, canvas)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -0,0 +1,35 @@
+import os
+
+import cv2
+import pytest
+from src.processing.image_processor import ImageProcessor
+from src.processing.ocr_engine import OCREngine
+from src.processing.validator import Validator
+
+cv2.setUseOptimized(True)
+# Each pytest-xdist worker is its own process; one OpenCV thread per worker
+# keeps N workers from each starting a pool sized to every core
+if os.environ.get("PYTEST_XDIST_WORKER"):
+    cv2.setNumThreads(1)
+
+@pytest.fixture(scope="session")
+def image_processor():
+    """One ImageProcessor for the session, so its work buffers are reused across tests."""
+    return ImageProcessor()
+
+@pytest.fixture(scope="session")
+def _session_ocr_engine():
+    """One OCREngine for the session; its result cache is keyed by image and config."""
+    return OCREngine()
+
+@pytest.fixture
+def ocr_engine(_session_ocr_engine):
+    """Shared OCREngine, with the PSM restored after each test that changes it."""
+    psm = _session_ocr_engine.get_psm()
+    yield _session_ocr_engine
+    _session_ocr_engine.set_psm(psm)
+
+@pytest.fixture(scope="session")
+def validator():
+    """One Validator for the session; it keeps no per-call state."""
+    return Validator()
@@ -8,7 +8,7 @@ import shutil
 from src.processing.data_processor import (
     DataProcessor, ProcessingStatus, ProcessingResult, BatchResult
 )
-from src.processing.pattern_matcher import MedicalReading, ReadingType
+from src.processing.pattern_matcher import MedicalReading, ReadingType, ReadingsBatch
 
 @pytest.fixture
 def temp_dir():
@@ -107,6 +107,19 @@ def test_process_batch(temp_dir, sample_image_results):
     result_files = list(Path(temp_dir).glob('batch_*.json'))
     assert len(result_files) == 1
 
+def test_process_batch_parallel(temp_dir, sample_image_results):
+    """Test that a batch large enough for the process pool matches serial processing."""
+    processor = DataProcessor(output_dir=temp_dir)
+    image_results = sample_image_results * 40
+    
+    parallel = processor.process_batch(image_results, max_workers=2)
+    serial = processor.process_batch(image_results, max_workers=1)
+    
+    assert parallel.total_images == 80
+    assert parallel.successful_images == serial.successful_images == 40
+    assert parallel.summary == serial.summary
+    assert [r.image_path for r in parallel.results] == [r.image_path for r in serial.results]
+
 def test_export_to_csv(temp_dir, sample_image_results):
     """Test exporting batch results to CSV."""
     processor = DataProcessor(output_dir=temp_dir)
@@ -127,6 +140,21 @@ def test_export_to_csv(temp_dir, sample_image_results):
     # Check data rows (should have 4 rows - 3 readings from first image + 1 from second)
     assert len(lines) == 5  # Header + 4 data rows
 
+def test_process_single_image_with_readings_batch(temp_dir, sample_readings):
+    """Test that a ReadingsBatch is processed like the equivalent list."""
+    processor = DataProcessor(output_dir=temp_dir)
+    batch = ReadingsBatch.from_readings(sample_readings, 95.0)
+    
+    result = processor.process_single_image(
+        image_path='test_image.jpg',
+        readings=batch,
+        confidence=95.0
+    )
+    
+    assert result.status == ProcessingStatus.PARTIAL
+    assert result.error_message == "Only 2 of 3 readings are valid"
+    assert [r.type for r in result.readings] == [r.type for r in sample_readings]
+
 def test_error_handling(temp_dir):
     """Test error handling in data processing."""
     processor = DataProcessor(output_dir=temp_dir)
@@ -0,0 +1,41 @@
+import numpy as np
+import cv2
+from src.processing.disk_writer import DiskWriter
+
+def test_disk_writer_writes_images_and_bytes(tmp_path):
+    """Test that queued images and raw bytes are on disk after close."""
+    image = np.full((20, 30, 3), 128, dtype=np.uint8)
+    image_path = str(tmp_path / "image.png")
+    text_path = str(tmp_path / "readings.txt")
+
+    with DiskWriter(max_pending=2) as writer:
+        writer.submit(image_path, image)
+        writer.submit(text_path, b"98.6F\n")
+
+    saved = cv2.imread(image_path)
+    assert saved is not None
+    assert np.array_equal(saved, image)
+    with open(text_path, 'rb') as f:
+        assert f.read() == b"98.6F\n"
+
+def test_disk_writer_close_without_writes():
+    """Test that closing an idle writer does not block."""
+    writer = DiskWriter()
+    writer.close()
+    writer.start()
+    writer.close()
+
+def test_disk_writer_jpeg_quality(tmp_path):
+    """Test that lower JPEG quality produces a smaller file."""
+    rng = np.random.default_rng(0)
+    image = rng.integers(0, 256, (64, 64, 3), dtype=np.uint8)
+    low_path = tmp_path / "low.jpg"
+    high_path = tmp_path / "high.jpg"
+
+    with DiskWriter(jpeg_quality=30) as writer:
+        writer.submit(str(low_path), image)
+    with DiskWriter(jpeg_quality=95) as writer:
+        writer.submit(str(high_path), image)
+
+    assert cv2.imread(str(low_path)) is not None
+    assert low_path.stat().st_size < high_path.stat().st_size
@@ -2,7 +2,10 @@ import pytest
 import cv2
 import numpy as np
 import os
-from src.processing.image_capture import ImageCapture
+import queue
+import threading
+import time
+from src.processing.image_capture import ImageCapture, _CaptureThread, _READ_RETRY_DELAY
 from src.processing.pattern_matcher import ReadingType
 
 # Assuming synthetic images are generated in this path
@@ -82,4 +85,61 @@ def test_capture_and_process():
         assert isinstance(confidence, float)
         
         # Readings should be a list
-        assert isinstance(readings, list) 
\ No newline at end of file
+        assert isinstance(readings, list)
+
+class FakeVideoCapture:
+    """Stand-in for cv2.VideoCapture that serves a fixed list of frames, then fails."""
+
+    def __init__(self, frames, repeat=False):
+        self.frames = list(frames)
+        self.repeat = repeat
+        self.reads = 0
+
+    def read(self):
+        self.reads += 1
+        if self.repeat:
+            return True, self.frames[0]
+        if self.frames:
+            return True, self.frames.pop(0)
+        return False, None
+
+def test_capture_thread_drops_oldest_frames():
+    """Test that a full queue keeps the newest frames and that failed reads end the thread."""
+    frames = [np.full((2, 2), i, dtype=np.uint8) for i in range(5)]
+    cap = FakeVideoCapture(frames)
+    queued = queue.Queue(maxsize=2)
+    thread = _CaptureThread(cap, queued, threading.Event(), max_read_failures=3)
+    thread.start()
+    thread.join(timeout=2)
+
+    assert not thread.is_alive()
+    assert [int(queued.get_nowait()[0, 0]) for _ in range(queued.qsize())] == [3, 4]
+    # Five frames, then three failed reads before giving up
+    assert cap.reads == 8
+
+def test_capture_thread_waits_between_failed_reads():
+    """Test that failed reads are retried with a pause instead of a busy loop."""
+    cap = FakeVideoCapture([])
+    thread = _CaptureThread(cap, queue.Queue(maxsize=2), threading.Event(), max_read_failures=5)
+    start = time.perf_counter()
+    thread.start()
+    thread.join(timeout=2)
+
+    assert not thread.is_alive()
+    assert cap.reads == 5
+    # Four waits between the five failed reads
+    assert time.perf_counter() - start >= 4 * _READ_RETRY_DELAY
+
+def test_capture_thread_stops_on_event():
+    """Test that setting the stop event ends a thread reading a live source."""
+    cap = FakeVideoCapture([np.zeros((2, 2), dtype=np.uint8)], repeat=True)
+    stop_event = threading.Event()
+    queued = queue.Queue(maxsize=2)
+    thread = _CaptureThread(cap, queued, stop_event)
+    thread.start()
+    queued.get(timeout=1)
+    stop_event.set()
+    thread.join(timeout=1)
+
+    assert not thread.is_alive()
+    assert queued.qsize() <= 2
@@ -0,0 +1,95 @@
+import copy
+import pickle
+
+import pytest
+from src.processing.number_extractor import NumberExtractor, ExtractedNumber
+
+@pytest.fixture
+def extractor():
+    return NumberExtractor()
+
+def test_blood_pressure_reported_once(extractor):
+    """Test that overlapping BP variants yield a single systolic/diastolic pair."""
+    numbers = extractor.extract_numbers("BP: 120/80 mmHg", confidence=90.0)
+    assert [(n.value, n.unit) for n in numbers] == [(120, 'mmHg'), (80, 'mmHg')]
+
+def test_multiple_reading_types(extractor):
+    """Test that each reading type is extracted with its unit."""
+    text = "98.6F\nSpO2: 97%\nHR: 72\n150.5 lbs"
+    numbers = extractor.extract_numbers(text, confidence=90.0)
+    assert [(n.value, n.unit) for n in numbers] == [
+        (98.6, '°F'), (150.5, 'lbs'), (97, '%'), (72, 'BPM')
+    ]
+
+def test_unit_on_separate_line(extractor):
+    """Test readings whose unit is on the line above or below."""
+    assert [n.value for n in extractor.extract_numbers("kg\n68.2", confidence=90.0)] == [68.2]
+    assert [n.value for n in extractor.extract_numbers("98\n%", confidence=90.0)] == [98]
+
+def test_numbers_inside_longer_digit_runs_ignored(extractor):
+    """Test that readings are not carved out of longer numbers."""
+    assert extractor.extract_numbers("ID 12345/678", confidence=90.0) == []
+    assert extractor.extract_numbers("1098%", confidence=90.0) == []
+
+@pytest.mark.parametrize("text,expected", [
+    ("HR:     72", [(72, 'BPM')]),
+    ("72    BPM", [(72, 'BPM')]),
+    ("lbs     150.5", [(150.5, 'lbs')]),
+    ("SpO2:\t\t 97      %", [(97, '%')]),
+    ("F      98.6", [(98.6, '°F')]),
+])
+def test_runs_of_spaces_between_value_and_unit(extractor, text, expected):
+    """Test that OCR runs of spaces or tabs between a value and its label still match."""
+    assert [(n.value, n.unit) for n in extractor.extract_numbers(text, confidence=90.0)] == expected
+
+def test_prefilter_does_not_change_results(extractor, monkeypatch):
+    """Test that skipping types by trigger literal finds the same numbers as scanning all."""
+    texts = [
+        "BP: 120/80\nSpO2: 97%\nHR: 72",
+        "Temp 98.6F", "c37.5", "kilos\n68.2", "68.2\nKG", "72\nBPM", "no readings here 123",
+    ]
+    filtered = [[(n.value, n.unit) for n in extractor.extract_numbers(t, 90.0)] for t in texts]
+    
+    monkeypatch.setattr(NumberExtractor, 'TRIGGERS', {name: ('',) for name in NumberExtractor.TRIGGERS})
+    unfiltered = [[(n.value, n.unit) for n in extractor.extract_numbers(t, 90.0)] for t in texts]
+    
+    assert filtered == unfiltered
+    assert filtered[-1] == []
+
+def test_validate_readings_matches_validate_reading(extractor):
+    """Test that batch validation agrees with per-number validation."""
+    numbers = extractor.extract_numbers("BP: 250/80\n98.6F\n30.5C\nSpO2: 99%\nHR: 35", confidence=90.0)
+    numbers.append(ExtractedNumber(value=351, unit=None, confidence=90.0, raw_text="351"))
+    
+    valid = extractor.validate_readings(numbers)
+    
+    assert valid.tolist() == [extractor.validate_reading(n) for n in numbers]
+    assert valid.tolist() == [False, True, True, False, True, False, True]
+    assert extractor.validate_readings([]).tolist() == []
+
+def test_extract_number_tuples_matches_extract_numbers(extractor):
+    """Test that the tuple API returns the same fields as ExtractedNumber objects."""
+    text = "BP: 120/80\n98.6F\nSpO2: 97%"
+    numbers = extractor.extract_numbers(text, confidence=90.0)
+    tuples = extractor.extract_number_tuples(text, confidence=90.0)
+    assert tuples == [(n.value, n.unit, n.confidence, n.raw_text) for n in numbers]
+
+def test_extracted_number_pickle_and_copy(extractor):
+    """Test that extracted numbers survive pickling and copying."""
+    numbers = extractor.extract_numbers("98.6F\nHR: 72", confidence=90.0)
+    assert pickle.loads(pickle.dumps(numbers)) == numbers
+    assert copy.deepcopy(numbers) == numbers
+    assert copy.copy(numbers[0]) == numbers[0]
+
+def test_subclass_patterns_compiled_separately(extractor):
+    """Test that a subclass overriding PATTERNS does not reuse the base's compiled patterns."""
+    class OxygenOnlyExtractor(NumberExtractor):
+        PATTERNS = {'oxygen': [r'(?<!\d)(\d{2,3})\s*%']}
+
+    text = "SpO2: 97%\nHR: 72"
+    subclass_numbers = OxygenOnlyExtractor().extract_numbers(text, confidence=90.0)
+    assert [(n.value, n.unit) for n in subclass_numbers] == [(97, '%')]
+    assert [(n.value, n.unit) for n in extractor.extract_numbers(text, confidence=90.0)] == [
+        (97, '%'), (72, 'BPM')
+    ]
+    assert set(NumberExtractor().compiled_patterns) == set(NumberExtractor.PATTERNS)
@@ -1,9 +1,47 @@
 import os
+import cv2
+import numpy as np
+import pytesseract
 import pytest
 from src.processing.image_processor import ImageProcessor
 from src.processing.ocr_engine import OCREngine
 
-def test_ocr_extraction():
+# Column header of Tesseract's image_to_data TSV output
+TSV_HEADER = "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\tleft\ttop\twidth\theight\tconf\ttext\n"
+
+def fake_tsv(*rows):
+    """
+    Build image_to_data TSV output from rows of column values.
+
+    Args:
+        rows: One tuple per entry, in TSV_HEADER column order
+
+    Returns:
+        str: The header followed by one tab-separated line per row
+    """
+    return TSV_HEADER + ''.join('\t'.join(map(str, row)) + '\n' for row in rows)
+
+@pytest.fixture
+def fake_tesseract(monkeypatch):
+    """
+    Stub out pytesseract.image_to_data.
+
+    Returns a function that installs the stub. It takes the TSV to return, or
+    a callable mapping the config string to the TSV, and returns the list the
+    stub appends each call's config string to.
+    """
+    def install(tsv):
+        calls = []
+
+        def fake_image_to_data(image, config=''):
+            calls.append(config)
+            return tsv(config) if callable(tsv) else tsv
+
+        monkeypatch.setattr(pytesseract, 'image_to_data', fake_image_to_data)
+        return calls
+    return install
+
+def test_ocr_extraction(image_processor, ocr_engine):
     """Test OCR extraction from a medical device image."""
     # Get the directory where this test file is located
     test_dir = os.path.dirname(os.path.abspath(__file__))
@@ -13,16 +51,12 @@ def test_ocr_extraction():
     # Check if the image file exists
     assert os.path.exists(image_path), f"Test image not found at {image_path}"
 
-    # Initialize the image processor and OCR engine
-    processor = ImageProcessor()
-    engine = OCREngine()
-
     # Load and preprocess the image
-    image = processor.load_image(image_path)
-    preprocessed = processor.preprocess_for_ocr(image)
+    image = image_processor.load_image(image_path, mode='gray')
+    preprocessed = image_processor.preprocess_for_ocr(image)
 
     # Extract text from the preprocessed image
-    text, confidence = engine.extract_with_confidence(preprocessed)
+    text, confidence = ocr_engine.extract_with_confidence(preprocessed)
 
     # Assert that text was extracted
     assert text, "No text was extracted from the image."
@@ -32,4 +66,119 @@ def test_ocr_extraction():
     print(f"Confidence: {confidence}")
 
     # Optionally, assert that the confidence is above a certain threshold
-    assert confidence > 0.5, "OCR confidence is too low." 
\ No newline at end of file
+    assert confidence > 0.5, "OCR confidence is too low."
+
+def test_extract_with_confidence_single_tesseract_call(fake_tesseract):
+    """Test that text and confidence come from one image_to_data call."""
+    calls = fake_tesseract(fake_tsv(
+        (1, 1, 0, 0, 0, 0, 0, 0, 10, 10, -1, ''),
+        (5, 1, 1, 1, 1, 1, 0, 0, 5, 5, 90, '98.6F'),
+        (4, 1, 1, 1, 2, 0, 0, 5, 5, 5, -1, ''),
+        (5, 1, 1, 1, 2, 1, 0, 5, 2, 5, 70.4, 'HR'),
+        (5, 1, 1, 1, 2, 2, 3, 5, 2, 5, 80, '72'),
+    ))
+    text, confidence = OCREngine().extract_with_confidence(np.zeros((10, 10), dtype=np.uint8))
+
+    assert len(calls) == 1
+    assert text == "98.6F\nHR 72"
+    assert confidence == 80.0
+
+def test_extract_batch_preserves_order(monkeypatch):
+    """Test that batch OCR returns one result per image in input order."""
+    def fake_extract(self, image):
+        return str(int(image[0, 0])), float(image[0, 0])
+
+    monkeypatch.setattr(OCREngine, 'extract_with_confidence', fake_extract)
+    images = [np.full((4, 4), i, dtype=np.uint8) for i in range(6)]
+    results = OCREngine().extract_batch(images, max_workers=3)
+
+    assert results == [(str(i), float(i)) for i in range(6)]
+    assert OCREngine().extract_batch([]) == []
+
+def test_extract_with_confidence_caches_identical_images(fake_tesseract):
+    """Test that repeated identical images are recognised only once."""
+    calls = fake_tesseract(fake_tsv((5, 1, 1, 1, 1, 1, 0, 0, 5, 5, 90, '98.6F')))
+    engine = OCREngine()
+    image = np.zeros((10, 10), dtype=np.uint8)
+
+    first = engine.extract_with_confidence(image)
+    assert engine.extract_with_confidence(image.copy()) == first
+    assert len(calls) == 1
+
+    # A different image or a different PSM must run OCR again
+    engine.extract_with_confidence(np.ones((10, 10), dtype=np.uint8))
+    engine.set_psm('6')
+    engine.extract_with_confidence(image)
+    assert len(calls) == 3
+
+def test_extract_word_arrays_matches_detailed_data(fake_tesseract):
+    """Test that the array form holds the same words as extract_detailed_data."""
+    fake_tesseract(fake_tsv(
+        (1, 1, 0, 0, 0, 0, 0, 0, 10, 10, -1, ''),
+        (5, 1, 1, 1, 1, 1, 0, 0, 5, 5, 90, '98.6F'),
+        (5, 1, 1, 1, 2, 1, 0, 5, 2, 5, 70.4, 'HR'),
+        (5, 1, 1, 1, 2, 2, 3, 5, 2, 5, 80, ' '),
+    ))
+    engine = OCREngine()
+    image = np.zeros((10, 10), dtype=np.uint8)
+    words = engine.extract_word_arrays(image)
+    detailed = engine.extract_detailed_data(image)
+
+    assert len(words) == 2
+    assert words.text == [w['text'] for w in detailed]
+    assert words.conf.tolist() == [w['conf'] for w in detailed]
+    assert words.left.tolist() == [w['left'] for w in detailed]
+    assert words.height.tolist() == [w['height'] for w in detailed]
+
+def test_load_image_gray_mode():
+    """Test that gray loading matches loading in color and converting."""
+    image_path = os.path.join(os.path.dirname(__file__), 'test_data', 'digit_confusion', 'img_835.png')
+    processor = ImageProcessor()
+    gray = processor.load_image(image_path, mode='gray')
+    color = processor.load_image(image_path)
+
+    assert gray.ndim == 2
+    assert np.array_equal(gray, cv2.cvtColor(color, cv2.COLOR_BGR2GRAY))
+
+def test_extract_multi_psm(fake_tesseract):
+    """Test that each PSM gets its own Tesseract run and the engine PSM is kept."""
+    def psm_tsv(config):
+        psm = config.split('--psm ')[1].split()[0]
+        return fake_tsv((5, 1, 1, 1, 1, 1, 0, 0, 5, 5, psm, f'psm{psm}'))
+
+    fake_tesseract(psm_tsv)
+    engine = OCREngine()
+    results = engine.extract_multi_psm(np.zeros((10, 10, 3), dtype=np.uint8), ['6', '7', '13'], max_workers=2)
+
+    assert results == [('psm6', 6.0), ('psm7', 7.0), ('psm13', 13.0)]
+    assert engine.get_psm() == '7'
+    assert engine.extract_multi_psm(np.zeros((10, 10), dtype=np.uint8), []) == []
+
+def test_config_string_reused_across_psm_switches():
+    """Test that switching PSM back reuses the same config string."""
+    engine = OCREngine()
+    original = engine._get_config_string()
+    engine.set_psm('6')
+    assert '--psm 6' in engine._get_config_string()
+    engine.set_psm('7')
+    assert engine._get_config_string() is original
+    assert OCREngine()._get_config_string() is original
+
+def test_header_only_tsv_yields_no_text(fake_tesseract):
+    """Test that a TSV with no entries gives empty results rather than an error."""
+    fake_tesseract(TSV_HEADER)
+    image = np.zeros((10, 10), dtype=np.uint8)
+    engine = OCREngine()
+
+    assert engine.extract_with_confidence(image) == ("", 0.0)
+    assert engine.extract_batch([image, np.ones((10, 10), dtype=np.uint8)], max_workers=2) == [("", 0.0), ("", 0.0)]
+    assert engine.get_confidence(image) == 0.0
+    assert engine.extract_detailed_data(image) == []
+    assert len(engine.extract_word_arrays(image)) == 0
+
+def test_extract_multi_psm_header_only_tsv(fake_tesseract):
+    """Test that PSM runs with no recognised entries give empty results."""
+    fake_tesseract(TSV_HEADER)
+    results = OCREngine().extract_multi_psm(np.zeros((10, 10), dtype=np.uint8), ['6', '7'])
+
+    assert results == [("", 0.0), ("", 0.0)]
@@ -1,10 +1,14 @@
 import os
+
 import pytest
 import cv2
 import numpy as np
 from src.processing.image_processor import ImageProcessor
 from src.processing.ocr_engine import OCREngine
 
+# Downsampling factor for the display contour search in preprocess_image
+CONTOUR_DOWNSAMPLE = 4
+
 def preprocess_image(image):
     """
     Enhanced preprocessing pipeline for real-world medical device photos.
@@ -15,8 +19,8 @@ def preprocess_image(image):
     Returns:
         Preprocessed image ready for OCR
     """
-    # Convert to grayscale
-    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    # Convert to grayscale unless the image was already loaded as gray
+    gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
     
     # Apply bilateral filter to reduce noise while preserving edges
     denoised = cv2.bilateralFilter(gray, 9, 75, 75)
@@ -35,13 +39,16 @@ def preprocess_image(image):
         2    # C constant
     )
     
-    # Find contours to detect the display area
-    contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    # Find contours to detect the display area. Only a bounding box is needed,
+    # so trace them on a downsampled copy and scale the box back up.
+    small = cv2.resize(thresh, None, fx=1 / CONTOUR_DOWNSAMPLE, fy=1 / CONTOUR_DOWNSAMPLE,
+                       interpolation=cv2.INTER_AREA)
+    contours, _ = cv2.findContours(small, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
     
     if contours:
         # Find the largest contour (should be the display)
         largest_contour = max(contours, key=cv2.contourArea)
-        x, y, w, h = cv2.boundingRect(largest_contour)
+        x, y, w, h = [v * CONTOUR_DOWNSAMPLE for v in cv2.boundingRect(largest_contour)]
         
         # Add padding around the detected region
         padding = 10
@@ -68,52 +75,78 @@ def preprocess_image(image):
     
     return cleaned
 
-def test_ocr_real_world():
-    """Test OCR extraction from real-world medical device photos."""
-    # Initialize the image processor and OCR engine
+# TODO: Add real-world test images
+# For now, we'll use the synthetic images to test the enhanced preprocessing
+IMAGE_PATHS = [
+    os.path.join(os.path.dirname(__file__), 'thermometer_synth_1.png'),
+    os.path.join(os.path.dirname(__file__), 'thermometer_synth_2.png'),
+    os.path.join(os.path.dirname(__file__), 'thermometer_synth_3.png')
+]
+
+@pytest.fixture(scope="session")
+def preprocessed_images():
+    """Load and preprocess each test image once per session.
+
+    Maps image path to (image, preprocessed), with both None if the image
+    could not be loaded.
+    """
     processor = ImageProcessor()
-    engine = OCREngine()
+    images = {}
+    for image_path in IMAGE_PATHS:
+        image = processor.load_image(image_path, mode='gray')
+        images[image_path] = (image, preprocess_image(image) if image is not None else None)
+    return images
+
+def best_psm_result(engine, preprocessed):
+    """
+    Run OCR on a preprocessed image with several PSM modes and keep the best.
+    
+    The PSM runs are threaded inside extract_multi_psm, so images are passed
+    in one at a time rather than fanned out again.
+    
+    Args:
+        engine: OCREngine to run the PSM modes with
+        preprocessed: Preprocessed image
+        
+    Returns:
+        Tuple of (best_text, best_confidence)
+    """
+    # Try different PSM modes for better accuracy
+    psm_modes = ['3', '4', '6', '7', '8', '13']  # Added more PSM modes
+    best_text = ""
+    best_confidence = 0.0
     
+    results = engine.extract_multi_psm(preprocessed, psm_modes)
+    for psm, (text, confidence) in zip(psm_modes, results):
+        print(f"PSM {psm}: Text='{text}', Confidence={confidence:.2f}%")
+        
+        if confidence > best_confidence:
+            best_text = text
+            best_confidence = confidence
+    
+    return best_text, best_confidence
+
+def test_ocr_real_world(preprocessed_images):
+    """Test OCR extraction from real-world medical device photos."""
     # Create debug directory if it doesn't exist
     debug_dir = os.path.join(os.path.dirname(__file__), 'debug_output')
     os.makedirs(debug_dir, exist_ok=True)
     
-    # TODO: Add real-world test images
-    # For now, we'll use the synthetic images to test the enhanced preprocessing
-    image_paths = [
-        os.path.join(os.path.dirname(__file__), 'thermometer_synth_1.png'),
-        os.path.join(os.path.dirname(__file__), 'thermometer_synth_2.png'),
-        os.path.join(os.path.dirname(__file__), 'thermometer_synth_3.png')
-    ]
-    
-    print("\n=== Real-World OCR Extraction Results ===")
-    for image_path in image_paths:
-        # Load image
-        image = processor.load_image(image_path)
+    for image_path, (image, preprocessed) in preprocessed_images.items():
         assert image is not None, f"Failed to load image: {image_path}"
         
-        # Apply enhanced preprocessing
-        preprocessed = preprocess_image(image)
-        
         # Save preprocessed image for debugging
         debug_path = os.path.join(debug_dir, f"preprocessed_{os.path.basename(image_path)}")
         cv2.imwrite(debug_path, preprocessed)
         print(f"Saved preprocessed image to: {debug_path}")
-        
-        # Try different PSM modes for better accuracy
-        psm_modes = ['3', '4', '6', '7', '8', '13']  # Added more PSM modes
-        best_text = ""
-        best_confidence = 0.0
-        
-        for psm in psm_modes:
-            engine.set_psm(psm)
-            text, confidence = engine.extract_with_confidence(preprocessed)
-            print(f"PSM {psm}: Text='{text}', Confidence={confidence:.2f}%")
-            
-            if confidence > best_confidence:
-                best_text = text
-                best_confidence = confidence
-        
+    
+    # One image at a time; extract_multi_psm already runs each image's PSM modes concurrently
+    engine = OCREngine()
+    image_paths = list(preprocessed_images)
+    results = [best_psm_result(engine, preprocessed_images[path][1]) for path in image_paths]
+    
+    print("\n=== Real-World OCR Extraction Results ===")
+    for image_path, (best_text, best_confidence) in zip(image_paths, results):
         # Print results
         print(f"\nImage: {os.path.basename(image_path)}")
         print(f"Expected value: {os.path.basename(image_path).replace('thermometer_synth_', '').replace('.png', '')}")
@@ -125,4 +158,4 @@ def test_ocr_real_world():
         assert best_text, f"No text was extracted from the image: {image_path}"
         
         # Assert that the confidence is above a certain threshold
-        assert best_confidence > 0.5, f"OCR confidence is too low for image: {image_path}" 
\ No newline at end of file
+        assert best_confidence > 0.5, f"OCR confidence is too low for image: {image_path}"
@@ -1,216 +1,205 @@
+import pickle
+import re
+
 import pytest
-from src.processing.pattern_matcher import PatternMatcher, ReadingType, MedicalReading, ValidationResult
+from src.processing import pattern_matcher as pattern_matcher_module
+from src.processing.pattern_matcher import PatternMatcher, ReadingType, MedicalReading, ReadingsBatch, ValidationResult
 
 @pytest.fixture
 def pattern_matcher():
     return PatternMatcher()
 
-def test_temperature_patterns(pattern_matcher):
-    test_cases = [
-        ("98.6F", 98.6, "F", True),
-        ("37.0°C", 37.0, "C", True),
-        ("F98.6", 98.6, "F", True),
-        ("°C37.0", 37.0, "C", True),
-        ("98.6F\n", 98.6, "F", True),
-        ("\nF98.6", 98.6, "F", True),
-        ("TEMP: 98.6F", 98.6, "F", True),
-        ("T: 98.6F", 98.6, "F", True),
-        ("105F", 105.0, "F", False),  # Too high
-        ("34C", 34.0, "C", False),    # Too low
-    ]
-    
-    for text, expected_value, expected_unit, expected_valid in test_cases:
-        readings = pattern_matcher.find_readings(text, 0.95)
-        assert len(readings) > 0, f"No temperature reading found in: {text}"
-        reading = readings[0]
-        assert reading.type == ReadingType.TEMPERATURE
-        assert reading.value == expected_value
-        assert reading.unit == expected_unit
-        assert reading.is_valid == expected_valid
+@pytest.mark.parametrize("text,expected_value,expected_unit,expected_valid", [
+    ("98.6F", 98.6, "F", True),
+    ("37.0°C", 37.0, "C", True),
+    ("F98.6", 98.6, "F", True),
+    ("°C37.0", 37.0, "C", True),
+    ("98.6F\n", 98.6, "F", True),
+    ("\nF98.6", 98.6, "F", True),
+    ("TEMP: 98.6F", 98.6, "F", True),
+    ("T: 98.6F", 98.6, "F", True),
+    ("105F", 105.0, "F", False),  # Too high
+    ("34C", 34.0, "C", False),    # Too low
+])
+def test_temperature_patterns(pattern_matcher, text, expected_value, expected_unit, expected_valid):
+    readings = pattern_matcher.find_readings(text, 0.95)
+    assert len(readings) > 0, f"No temperature reading found in: {text}"
+    reading = readings[0]
+    assert reading.type == ReadingType.TEMPERATURE
+    assert reading.value == expected_value
+    assert reading.unit == expected_unit
+    assert reading.is_valid == expected_valid
 
-def test_weight_patterns(pattern_matcher):
-    test_cases = [
-        ("150.5 lbs", 150.5, "lb", True),
-        ("68.2 kg", 68.2, "kg", True),
-        ("lbs 150.5", 150.5, "lb", True),
-        ("kg 68.2", 68.2, "kg", True),
-        ("WT: 150.5 lbs", 150.5, "lb", True),
-        ("W: 150.5 lbs", 150.5, "lb", True),
-        ("450 lbs", 450.0, "lb", False),  # Too high
-        ("15 kg", 15.0, "kg", False),     # Too low
-    ]
-    
-    for text, expected_value, expected_unit, expected_valid in test_cases:
-        readings = pattern_matcher.find_readings(text, 0.95)
-        assert len(readings) > 0, f"No weight reading found in: {text}"
-        reading = readings[0]
-        assert reading.type == ReadingType.WEIGHT
-        assert reading.value == expected_value
-        assert reading.unit == expected_unit
-        assert reading.is_valid == expected_valid
+@pytest.mark.parametrize("text,expected_value,expected_unit,expected_valid", [
+    ("150.5 lbs", 150.5, "lb", True),
+    ("68.2 kg", 68.2, "kg", True),
+    ("lbs 150.5", 150.5, "lb", True),
+    ("kg 68.2", 68.2, "kg", True),
+    ("WT: 150.5 lbs", 150.5, "lb", True),
+    ("W: 150.5 lbs", 150.5, "lb", True),
+    ("450 lbs", 450.0, "lb", False),  # Too high
+    ("15 kg", 15.0, "kg", False),     # Too low
+    ("70 kilos", 70.0, "kg", True),
+])
+def test_weight_patterns(pattern_matcher, text, expected_value, expected_unit, expected_valid):
+    readings = pattern_matcher.find_readings(text, 0.95)
+    assert len(readings) > 0, f"No weight reading found in: {text}"
+    reading = readings[0]
+    assert reading.type == ReadingType.WEIGHT
+    assert reading.value == expected_value
+    assert reading.unit == expected_unit
+    assert reading.is_valid == expected_valid
 
-def test_blood_pressure_patterns(pattern_matcher):
-    test_cases = [
-        ("120/80 mmHg", 120, "120/80 mmHg", True),
-        ("mmHg 120/80", 120, "120/80 mmHg", True),
-        ("BP: 120/80", 120, "120/80 mmHg", True),
-        ("SYS: 120 DIA: 80", 120, "120/80 mmHg", True),
-        ("S: 120 D: 80", 120, "120/80 mmHg", True),
-        ("85/60 mmHg", 85, "85/60 mmHg", False),  # Too low
-        ("150/95 mmHg", 150, "150/95 mmHg", False),  # Too high
-    ]
-    
-    for text, expected_systolic, expected_unit, expected_valid in test_cases:
-        readings = pattern_matcher.find_readings(text, 0.95)
-        assert len(readings) > 0, f"No blood pressure reading found in: {text}"
-        reading = readings[0]
-        assert reading.type == ReadingType.BLOOD_PRESSURE
-        assert reading.value == expected_systolic
-        assert reading.unit == expected_unit
-        assert reading.is_valid == expected_valid
+@pytest.mark.parametrize("text,expected_systolic,expected_unit,expected_valid", [
+    ("120/80 mmHg", 120, "120/80 mmHg", True),
+    ("mmHg 120/80", 120, "120/80 mmHg", True),
+    ("BP: 120/80", 120, "120/80 mmHg", True),
+    ("SYS: 120 DIA: 80", 120, "120/80 mmHg", True),
+    ("S: 120 D: 80", 120, "120/80 mmHg", True),
+    ("85/60 mmHg", 85, "85/60 mmHg", False),  # Too low
+    ("150/95 mmHg", 150, "150/95 mmHg", False),  # Too high
+])
+def test_blood_pressure_patterns(pattern_matcher, text, expected_systolic, expected_unit, expected_valid):
+    readings = pattern_matcher.find_readings(text, 0.95)
+    assert len(readings) > 0, f"No blood pressure reading found in: {text}"
+    reading = readings[0]
+    assert reading.type == ReadingType.BLOOD_PRESSURE
+    assert reading.value == expected_systolic
+    assert reading.unit == expected_unit
+    assert reading.is_valid == expected_valid
 
-def test_oxygen_patterns(pattern_matcher):
-    test_cases = [
-        ("98%", 98, "%", True),
-        ("%98", 98, "%", True),
-        ("SpO2: 98%", 98, "%", True),
-        ("O2: 98%", 98, "%", True),
-        ("65%", 65, "%", False),  # Too low
-        ("101%", 101, "%", False),  # Too high
-    ]
-    
-    for text, expected_value, expected_unit, expected_valid in test_cases:
-        readings = pattern_matcher.find_readings(text, 0.95)
-        assert len(readings) > 0, f"No oxygen reading found in: {text}"
-        reading = readings[0]
-        assert reading.type == ReadingType.OXYGEN
-        assert reading.value == expected_value
-        assert reading.unit == expected_unit
-        assert reading.is_valid == expected_valid
+@pytest.mark.parametrize("text,expected_value,expected_unit,expected_valid", [
+    ("98%", 98, "%", True),
+    ("%98", 98, "%", True),
+    ("SpO2: 98%", 98, "%", True),
+    ("O2: 98%", 98, "%", True),
+    ("65%", 65, "%", False),  # Too low
+    ("101%", 101, "%", False),  # Too high
+])
+def test_oxygen_patterns(pattern_matcher, text, expected_value, expected_unit, expected_valid):
+    readings = pattern_matcher.find_readings(text, 0.95)
+    assert len(readings) > 0, f"No oxygen reading found in: {text}"
+    reading = readings[0]
+    assert reading.type == ReadingType.OXYGEN
+    assert reading.value == expected_value
+    assert reading.unit == expected_unit
+    assert reading.is_valid == expected_valid
 
-def test_heart_rate_patterns(pattern_matcher):
-    test_cases = [
-        ("72 BPM", 72, "BPM", True),
-        ("BPM 72", 72, "BPM", True),
-        ("HR: 72", 72, "BPM", True),
-        ("PULSE: 72", 72, "BPM", True),
-        ("P: 72", 72, "BPM", True),
-        ("35 BPM", 35, "BPM", False),  # Too low
-        ("205 BPM", 205, "BPM", False),  # Too high
-    ]
-    
-    for text, expected_value, expected_unit, expected_valid in test_cases:
-        readings = pattern_matcher.find_readings(text, 0.95)
-        assert len(readings) > 0, f"No heart rate reading found in: {text}"
-        reading = readings[0]
-        assert reading.type == ReadingType.HEART_RATE
-        assert reading.value == expected_value
-        assert reading.unit == expected_unit
-        assert reading.is_valid == expected_valid
+@pytest.mark.parametrize("text,expected_value,expected_unit,expected_valid", [
+    ("72 BPM", 72, "BPM", True),
+    ("BPM 72", 72, "BPM", True),
+    ("HR: 72", 72, "BPM", True),
+    ("PULSE: 72", 72, "BPM", True),
+    ("P: 72", 72, "BPM", True),
+    ("35 BPM", 35, "BPM", False),  # Too low
+    ("205 BPM", 205, "BPM", False),  # Too high
+])
+def test_heart_rate_patterns(pattern_matcher, text, expected_value, expected_unit, expected_valid):
+    readings = pattern_matcher.find_readings(text, 0.95)
+    assert len(readings) > 0, f"No heart rate reading found in: {text}"
+    reading = readings[0]
+    assert reading.type == ReadingType.HEART_RATE
+    assert reading.value == expected_value
+    assert reading.unit == expected_unit
+    assert reading.is_valid == expected_valid
 
-def test_blood_glucose_patterns(pattern_matcher):
-    test_cases = [
-        ("120 mg/dL", 120, "mg/dL", True),
-        ("mg/dL 120", 120, "mg/dL", True),
-        ("6.7 mmol/L", 6.7, "mmol/L", True),
-        ("mmol/L 6.7", 6.7, "mmol/L", True),
-        ("BG: 120 mg/dL", 120, "mg/dL", True),
-        ("GLU: 120 mg/dL", 120, "mg/dL", True),
-        ("45 mg/dL", 45, "mg/dL", False),  # Too low
-        ("450 mg/dL", 450, "mg/dL", False),  # Too high
-        ("2.5 mmol/L", 2.5, "mmol/L", False),  # Too low
-        ("25 mmol/L", 25, "mmol/L", False),  # Too high
-    ]
-    
-    for text, expected_value, expected_unit, expected_valid in test_cases:
-        readings = pattern_matcher.find_readings(text, 0.95)
-        assert len(readings) > 0, f"No blood glucose reading found in: {text}"
-        reading = readings[0]
-        assert reading.type == ReadingType.BLOOD_GLUCOSE
-        assert reading.value == expected_value
-        assert reading.unit == expected_unit
-        assert reading.is_valid == expected_valid
+@pytest.mark.parametrize("text,expected_value,expected_unit,expected_valid", [
+    ("120 mg/dL", 120, "mg/dL", True),
+    ("mg/dL 120", 120, "mg/dL", True),
+    ("6.7 mmol/L", 6.7, "mmol/L", True),
+    ("mmol/L 6.7", 6.7, "mmol/L", True),
+    ("BG: 120 mg/dL", 120, "mg/dL", True),
+    ("GLU: 120 mg/dL", 120, "mg/dL", True),
+    ("45 mg/dL", 45, "mg/dL", False),  # Too low
+    ("450 mg/dL", 450, "mg/dL", False),  # Too high
+    ("2.5 mmol/L", 2.5, "mmol/L", False),  # Too low
+    ("25 mmol/L", 25, "mmol/L", False),  # Too high
+])
+def test_blood_glucose_patterns(pattern_matcher, text, expected_value, expected_unit, expected_valid):
+    readings = pattern_matcher.find_readings(text, 0.95)
+    assert len(readings) > 0, f"No blood glucose reading found in: {text}"
+    reading = readings[0]
+    assert reading.type == ReadingType.BLOOD_GLUCOSE
+    assert reading.value == expected_value
+    assert reading.unit == expected_unit
+    assert reading.is_valid == expected_valid
 
-def test_respiratory_rate_patterns(pattern_matcher):
-    test_cases = [
-        ("16 RR", 16, "breaths/min", True),
-        ("RR 16", 16, "breaths/min", True),
-        ("RR: 16", 16, "breaths/min", True),
-        ("RESP: 16", 16, "breaths/min", True),
-        ("R: 16", 16, "breaths/min", True),
-        ("6 RR", 6, "breaths/min", False),  # Too low
-        ("45 RR", 45, "breaths/min", False),  # Too high
-    ]
-    
-    for text, expected_value, expected_unit, expected_valid in test_cases:
-        readings = pattern_matcher.find_readings(text, 0.95)
-        assert len(readings) > 0, f"No respiratory rate reading found in: {text}"
-        reading = readings[0]
-        assert reading.type == ReadingType.RESPIRATORY_RATE
-        assert reading.value == expected_value
-        assert reading.unit == expected_unit
-        assert reading.is_valid == expected_valid
+@pytest.mark.parametrize("text,expected_value,expected_unit,expected_valid", [
+    ("16 RR", 16, "breaths/min", True),
+    ("RR 16", 16, "breaths/min", True),
+    ("RR: 16", 16, "breaths/min", True),
+    ("RESP: 16", 16, "breaths/min", True),
+    ("R: 16", 16, "breaths/min", True),
+    ("6 RR", 6, "breaths/min", False),  # Too low
+    ("45 RR", 45, "breaths/min", False),  # Too high
+])
+def test_respiratory_rate_patterns(pattern_matcher, text, expected_value, expected_unit, expected_valid):
+    readings = pattern_matcher.find_readings(text, 0.95)
+    assert len(readings) > 0, f"No respiratory rate reading found in: {text}"
+    reading = readings[0]
+    assert reading.type == ReadingType.RESPIRATORY_RATE
+    assert reading.value == expected_value
+    assert reading.unit == expected_unit
+    assert reading.is_valid == expected_valid
 
-def test_pain_scale_patterns(pattern_matcher):
-    test_cases = [
-        ("7/10", 7, "/10", True),
-        ("PAIN: 7/10", 7, "/10", True),
-        ("P: 7/10", 7, "/10", True),
-        ("7 out of 10", 7, "/10", True),
-        ("-1/10", -1, "/10", False),  # Too low
-        ("11/10", 11, "/10", False),  # Too high
-    ]
-    
-    for text, expected_value, expected_unit, expected_valid in test_cases:
-        readings = pattern_matcher.find_readings(text, 0.95)
-        assert len(readings) > 0, f"No pain scale reading found in: {text}"
-        reading = readings[0]
-        assert reading.type == ReadingType.PAIN_SCALE
-        assert reading.value == expected_value
-        assert reading.unit == expected_unit
-        assert reading.is_valid == expected_valid
+@pytest.mark.parametrize("text,expected_value,expected_unit,expected_valid", [
+    ("7/10", 7, "/10", True),
+    ("PAIN: 7/10", 7, "/10", True),
+    ("P: 7/10", 7, "/10", True),
+    ("7 out of 10", 7, "/10", True),
+    ("-1/10", -1, "/10", False),  # Too low
+    ("11/10", 11, "/10", False),  # Too high
+])
+def test_pain_scale_patterns(pattern_matcher, text, expected_value, expected_unit, expected_valid):
+    readings = pattern_matcher.find_readings(text, 0.95)
+    assert len(readings) > 0, f"No pain scale reading found in: {text}"
+    reading = readings[0]
+    assert reading.type == ReadingType.PAIN_SCALE
+    assert reading.value == expected_value
+    assert reading.unit == expected_unit
+    assert reading.is_valid == expected_valid
 
-def test_height_patterns(pattern_matcher):
-    test_cases = [
-        ("170 cm", 170, "cm", True),
-        ("cm 170", 170, "cm", True),
-        ("5'10\"", 70, "in", True),  # 5 feet 10 inches = 70 inches
-        ("5'10 in", 70, "in", True),
-        ("H: 170 cm", 170, "cm", True),
-        ("HT: 170 cm", 170, "cm", True),
-        ("25 cm", 25, "cm", False),  # Too low
-        ("260 cm", 260, "cm", False),  # Too high
-        ("5'0\"", 60, "in", True),
-        ("6'0\"", 72, "in", True),
-    ]
-    
-    for text, expected_value, expected_unit, expected_valid in test_cases:
-        readings = pattern_matcher.find_readings(text, 0.95)
-        assert len(readings) > 0, f"No height reading found in: {text}"
-        reading = readings[0]
-        assert reading.type == ReadingType.HEIGHT
-        assert reading.value == expected_value
-        assert reading.unit == expected_unit
-        assert reading.is_valid == expected_valid
+@pytest.mark.parametrize("text,expected_value,expected_unit,expected_valid", [
+    ("170 cm", 170, "cm", True),
+    ("cm 170", 170, "cm", True),
+    ("170 centimeters", 170, "cm", True),
+    ("Height: 165 centimeter", 165, "cm", True),
+    ("centimeters 170", 170, "cm", True),
+    ("5'10\"", 70, "in", True),  # 5 feet 10 inches = 70 inches
+    ("5'10 in", 70, "in", True),
+    ("H: 170 cm", 170, "cm", True),
+    ("HT: 170 cm", 170, "cm", True),
+    ("25 cm", 25, "cm", False),  # Too low
+    ("260 cm", 260, "cm", False),  # Too high
+    ("5'0\"", 60, "in", True),
+    ("6'0\"", 72, "in", True),
+])
+def test_height_patterns(pattern_matcher, text, expected_value, expected_unit, expected_valid):
+    readings = pattern_matcher.find_readings(text, 0.95)
+    assert len(readings) > 0, f"No height reading found in: {text}"
+    reading = readings[0]
+    assert reading.type == ReadingType.HEIGHT
+    assert reading.value == expected_value
+    assert reading.unit == expected_unit
+    assert reading.is_valid == expected_valid
 
-def test_temperature_validation(pattern_matcher):
-    test_cases = [
-        ("98.6F", True, 0.0, None, None),
-        ("98.6/", False, -20.0, "Invalid character '/' or '\\' in temperature", "98.6."),
-        ("98.6", False, -25.0, "Missing temperature unit (F or C)", "98.6°F"),
-        ("98.6.", False, -15.0, "Temperature ends with decimal point", "98.6"),
-        ("98.6F ", True, 0.0, None, None),
-        (" F98.6", True, 0.0, None, None),
-    ]
-    
-    for text, expected_valid, expected_adjustment, expected_reason, expected_correction in test_cases:
-        result = pattern_matcher.validate_temperature_format(text)
-        assert result.is_valid == expected_valid
-        assert result.confidence_adjustment == expected_adjustment
-        if expected_reason:
-            assert result.error_reason == expected_reason
-        if expected_correction:
-            assert result.suggested_correction == expected_correction
+@pytest.mark.parametrize("text,expected_valid,expected_adjustment,expected_reason,expected_correction", [
+    ("98.6F", True, 0.0, None, None),
+    ("98.6/", False, -20.0, "Invalid character '/' or '\\' in temperature", "98.6."),
+    ("98.6", False, -25.0, "Missing temperature unit (F or C)", "98.6°F"),
+    ("98.6.", False, -15.0, "Temperature ends with decimal point", "98.6"),
+    ("98.6F ", True, 0.0, None, None),
+    (" F98.6", True, 0.0, None, None),
+])
+def test_temperature_validation(pattern_matcher, text, expected_valid, expected_adjustment,
+                                expected_reason, expected_correction):
+    result = pattern_matcher.validate_temperature_format(text)
+    assert result.is_valid == expected_valid
+    assert result.confidence_adjustment == expected_adjustment
+    if expected_reason:
+        assert result.error_reason == expected_reason
+    if expected_correction:
+        assert result.suggested_correction == expected_correction
 
 def test_multiple_readings_in_text(pattern_matcher):
     text = """
@@ -260,4 +249,164 @@ def test_invalid_readings(pattern_matcher):
     print("\nFound readings:")
     for reading in readings:
         print(f"Type: {reading.type}, Value: {reading.value}, Unit: {reading.unit}, Valid: {reading.is_valid}")
-    assert len(readings) == 9 
\ No newline at end of file
+    assert len(readings) == 9
+
+def test_find_readings_as_batch(pattern_matcher):
+    text = "Temperature: 98.6F\nOxygen: 65%\nHeart Rate: 72 BPM"
+    
+    readings = pattern_matcher.find_readings(text, 0.95)
+    batch = pattern_matcher.find_readings(text, 0.95, as_batch=True)
+    
+    assert isinstance(batch, ReadingsBatch)
+    assert len(batch) == len(readings) == 3
+    assert int(batch.is_valid.sum()) == sum(r.is_valid for r in readings)
+    
+    counts = batch.type_counts()
+    assert counts[list(ReadingType).index(ReadingType.TEMPERATURE)] == 1
+    assert counts[list(ReadingType).index(ReadingType.OXYGEN)] == 0  # 65% is invalid
+    
+    round_trip = batch.to_readings()
+    assert [(r.type, r.value, r.unit, r.is_valid) for r in round_trip] == \
+        [(r.type, r.value, r.unit, r.is_valid) for r in readings]
+
+def test_repeated_text_on_later_line(pattern_matcher):
+    # 5'10" is dropped on the first line (one height per line) but still counts on the second
+    text = "Height: 170 cm 5'10\"\nHeight: 5'10\""
+    
+    readings = pattern_matcher.find_readings(text, 0.95)
+    
+    assert [(r.type, r.value, r.unit) for r in readings] == [
+        (ReadingType.HEIGHT, 170.0, 'cm'),
+        (ReadingType.HEIGHT, 70, 'in'),
+    ]
+
+def test_find_readings_batch(pattern_matcher):
+    pages = [
+        "Temperature: 98.6F\nBP: 120/80 mmHg",
+        "SpO2: 97%\nHR: 72",
+        "no readings on this page",
+    ] * 100
+    confidences = [0.9] * len(pages)
+    
+    def as_tuples(readings):
+        return [(r.type, r.value, r.unit, r.is_valid) for r in readings]
+    
+    expected = [as_tuples(pattern_matcher.find_readings(text, 0.9)) for text in pages]
+    parallel = pattern_matcher.find_readings_batch(pages, confidences, max_workers=2)
+    serial = pattern_matcher.find_readings_batch(pages, confidences, max_workers=1)
+    
+    assert [as_tuples(r) for r in parallel] == expected
+    assert [as_tuples(r) for r in serial] == expected
+
+def test_find_readings_batch_as_batch(pattern_matcher):
+    pages = ["Temperature: 98.6F\nBP: 120/80 mmHg", "no readings", "SpO2: 97%"]
+    
+    batch = pattern_matcher.find_readings_batch(pages, [0.9, 0.5, 0.7], max_workers=1, as_batch=True)
+    
+    assert isinstance(batch, ReadingsBatch)
+    assert batch.to_readings() == [r for text in pages for r in pattern_matcher.find_readings(text, 0.9)]
+    assert batch.confidence.tolist() == pytest.approx([0.9, 0.9, 0.7])
+    
+    empty = pattern_matcher.find_readings_batch([], [], as_batch=True)
+    assert len(empty) == 0
+
+class TemperatureOnlyMatcher(PatternMatcher):
+    """Subclass that only looks for temperatures; module-level so worker processes can load it."""
+    _DEFAULT_READING_TYPES = tuple(entry for entry in PatternMatcher._DEFAULT_READING_TYPES
+                                   if entry[2] is ReadingType.TEMPERATURE)
+    _HYPERSCAN_GATE = None
+
+def test_find_readings_batch_uses_subclass_in_workers():
+    matcher = TemperatureOnlyMatcher()
+    pages = ["Temperature: 98.6F\nBP: 120/80 mmHg", "SpO2: 97%\nHR: 72"] * 150
+    confidences = [0.9] * len(pages)
+    
+    parallel = matcher.find_readings_batch(pages, confidences, max_workers=2)
+    serial = matcher.find_readings_batch(pages, confidences, max_workers=1)
+    
+    assert parallel == serial
+    assert {r.type for readings in parallel for r in readings} == {ReadingType.TEMPERATURE}
+
+def test_repeated_text_shares_immutable_readings(pattern_matcher):
+    text = "Temperature: 98.6F\nHR: 72"
+    
+    first = pattern_matcher.find_readings(text, 0.95)
+    second = pattern_matcher.find_readings(text, 0.95)
+    
+    assert first == second
+    assert first is not second
+    with pytest.raises(AttributeError):
+        first[0].is_valid = False
+    with pytest.raises(AttributeError):
+        pattern_matcher.validate_temperature_format("98.6").is_valid = True
+
+class FakeHyperscan:
+    """re-backed stand-in for the hyperscan module, enough for _HyperscanGate."""
+    HS_FLAG_CASELESS = 1
+    HS_FLAG_SINGLEMATCH = 2
+    HS_MODE_BLOCK = 4
+
+    class Database:
+        def __init__(self, mode):
+            self.patterns = []
+
+        def compile(self, expressions, ids, elements, flags):
+            assert elements == len(expressions) == len(ids) == len(flags)
+            self.patterns = [
+                (pattern_id, re.compile(expression, re.IGNORECASE if flag & FakeHyperscan.HS_FLAG_CASELESS else 0))
+                for expression, pattern_id, flag in zip(expressions, ids, flags)
+            ]
+
+        def scan(self, data, match_event_handler, context):
+            for pattern_id, pattern in self.patterns:
+                match = pattern.search(data)
+                if match:
+                    match_event_handler(pattern_id, match.start(), match.end(), 0, context)
+
+def test_hyperscan_gate_matches_re_gate(monkeypatch):
+    monkeypatch.setattr(pattern_matcher_module, 'hyperscan', FakeHyperscan)
+    gate = pattern_matcher_module._HyperscanGate.build(PatternMatcher._DEFAULT_READING_TYPES)
+    assert gate is not None
+    assert gate.scan("HR: 72") == {ReadingType.HEART_RATE}
+    
+    class GatedMatcher(PatternMatcher):
+        _HYPERSCAN_GATE = gate
+    
+    class UngatedMatcher(PatternMatcher):
+        _HYPERSCAN_GATE = None
+    
+    texts = [
+        "Temperature: 98.6F\nBlood Pressure: 120/80 mmHg\nOxygen: 98%\nHeart Rate: 72 BPM",
+        "Weight: 150.5 lbs\nHeight: 5'10\"\nBlood Glucose: 120 mg/dL\nRespiratory Rate: 16 RR",
+        "Pain Scale: 7/10\nR: 18\nP: 72\nP: 4/10",
+        "TEMP: 37.0C 25 cm\nSPO2 97 percent\nGLUCOSE 5.5 MMOL/L\n70KG 154 lb",
+        "HR: 35 BPM\nF98.6\nsys 150/95\nno readings here 123",
+        "37.0\u00b0C\nWeight 72 kg",
+    ]
+    
+    def as_tuples(readings):
+        return [(r.type, r.value, r.unit, r.is_valid) for r in readings]
+    
+    for text in texts:
+        expected = as_tuples(UngatedMatcher().find_readings(text, 0.9))
+        assert expected, f"No readings found in: {text!r}"
+        assert as_tuples(GatedMatcher().find_readings(text, 0.9)) == expected
+
+def test_hyperscan_gate_warns_when_compile_fails(monkeypatch):
+    class RejectingDatabase(FakeHyperscan.Database):
+        def compile(self, **kwargs):
+            raise ValueError("unsupported pattern")
+    
+    monkeypatch.setattr(pattern_matcher_module, 'hyperscan', FakeHyperscan)
+    monkeypatch.setattr(FakeHyperscan, 'Database', RejectingDatabase)
+    
+    with pytest.warns(RuntimeWarning, match="unsupported pattern"):
+        assert pattern_matcher_module._HyperscanGate.build(PatternMatcher._DEFAULT_READING_TYPES) is None
+
+def test_readings_pickle_round_trip(pattern_matcher):
+    readings = pattern_matcher.find_readings("Temperature: 98.6F\nHR: 72", 0.95)
+    result = pattern_matcher.validate_temperature_format("98.6/")
+    
+    assert pickle.loads(pickle.dumps(readings)) == readings
+    assert pickle.loads(pickle.dumps(result)) == result
+    assert not hasattr(readings[0], '__dict__')
@@ -1,16 +1,17 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import numpy as np
 import cv2
 import os # Added for path manipulation if needed, though create_test_image returns array
-from src.processing.image_processor import ImageProcessor
-from src.processing.ocr_engine import OCREngine
 from src.processing.number_extractor import NumberExtractor, ExtractedNumber # Assuming this is the correct import
+from src.processing.image_processor import ImageProcessor
 from src.processing.validator import Validator, ValidationIssue
 
-def create_test_image():
-    """Create a test image with medical readings."""
+def _render_test_image():
+    """Render the medical readings test image."""
     # Create a white background (3-channel BGR image)
-    img = np.ones((400, 600, 3), dtype=np.uint8) * 255 # Height increased slightly for new line
+    img = np.full((400, 600, 3), 255, dtype=np.uint8) # Height increased slightly for new line
     
     # Add some text
     cv2.putText(img, "BP: 120/80", (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 0), 2)
@@ -20,46 +21,68 @@ def create_test_image():
     
     return img
 
-def test_image_processor():
+# Rendered once at import; tests get their own copy
+_TEMPLATE_IMG = _render_test_image()
+
+def create_test_image():
+    """Create a test image with medical readings."""
+    return _TEMPLATE_IMG.copy()
+
+def test_image_processor(image_processor):
     """Test image processing functions."""
-    processor = ImageProcessor()
     
     # Create test image
     test_img = create_test_image()
     
     # Test validation
-    assert processor.validate_image(test_img) == True
-    assert processor.validate_image(None) == False
+    assert image_processor.validate_image(test_img) == True
+    assert image_processor.validate_image(None) == False
     
     # Test resize
-    resized = processor.resize_image(test_img, max_dimension=300)
+    resized = image_processor.resize_image(test_img, max_dimension=300)
     assert resized.shape[0] <= 300 or resized.shape[1] <= 300
     
     # Test preprocessing
-    preprocessed = processor.preprocess_for_ocr(test_img)
+    preprocessed = image_processor.preprocess_for_ocr(test_img)
     # Check that the output is grayscale (2D) and has the same height and width
     assert len(preprocessed.shape) == 2
     assert preprocessed.shape[0] == test_img.shape[0]
     assert preprocessed.shape[1] == test_img.shape[1]
     assert preprocessed.dtype == np.uint8
 
-def test_ocr_engine():
+def test_image_processors_preprocess_in_parallel():
+    """Test that processors used from separate threads match a serial run."""
+    test_img = create_test_image()
+    expected = ImageProcessor().preprocess_for_ocr(test_img).copy()
+    processors = [ImageProcessor() for _ in range(4)]
+    assert processors[0]._clahe is not processors[1]._clahe
+    
+    def run(processor):
+        # Each processor stays on one thread; only the threads overlap
+        return [processor.preprocess_for_ocr(test_img).copy() for _ in range(5)]
+    
+    with ThreadPoolExecutor(max_workers=len(processors)) as executor:
+        results = [result for batch in executor.map(run, processors) for result in batch]
+    
+    for result in results:
+        np.testing.assert_array_equal(result, expected)
+
+def test_ocr_engine(ocr_engine):
     """Test OCR functionality."""
-    engine = OCREngine()
     
     # Create test image
     test_img = create_test_image()
     
     # Test text extraction
-    text = engine.extract_text(test_img)
+    text = ocr_engine.extract_text(test_img)
     assert isinstance(text, str)
     
     # Test confidence
-    confidence = engine.get_confidence(test_img)
+    confidence = ocr_engine.get_confidence(test_img)
     assert 0 <= confidence <= 100
     
     # Test combined extraction
-    text, conf = engine.extract_with_confidence(test_img)
+    text, conf = ocr_engine.extract_with_confidence(test_img)
     assert isinstance(text, str)
     assert 0 <= conf <= 100
 
@@ -88,23 +111,21 @@ def test_number_extractor():
     assert extractor.validate_reading(valid_bp) == True
     assert extractor.validate_reading(invalid_bp) == False
 
-def test_integration():
+def test_integration(image_processor, ocr_engine):
     """Test integration of all components."""
     # Create test image
     test_img = create_test_image()
     
     # Process image
-    processor = ImageProcessor()
-    preprocessed = processor.preprocess_for_ocr(test_img)
+    preprocessed = image_processor.preprocess_for_ocr(test_img)
     
     # Perform OCR
-    engine = OCREngine() # Using default config, PSM might need adjustment for block text
-    # Consider engine = OCREngine(config={'--psm': '6'}) if full block OCR is better
-    text, confidence = engine.extract_with_confidence(preprocessed)
+    # Shared engine uses the default config; PSM 6 may suit full block text better
+    text, confidence = ocr_engine.extract_with_confidence(preprocessed)
     print(f"Raw OCR Text:\n{text}")
     print(f"Overall Confidence: {confidence:.2f}%")
 
-    word_data = engine.extract_detailed_data(preprocessed)
+    word_data = ocr_engine.extract_detailed_data(preprocessed)
     assert word_data is not None, "extract_detailed_data failed"
     # print(f"Word Data: {word_data}") # Can be verbose
 
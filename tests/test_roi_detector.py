@@ -6,7 +6,7 @@ from src.processing.roi_detector import ROIDetector, DisplayRegion
 def create_test_image():
     """Create a test image with simulated medical device displays."""
     # Create a white background
-    img = np.ones((600, 800, 3), dtype=np.uint8) * 255
+    img = np.full((600, 800, 3), 255, dtype=np.uint8)
     
     # Draw main display (LCD-like): uniform mid-gray fill, thick black border
     cv2.rectangle(img, (100, 100), (400, 300), (160, 160, 160), -1)  # LCD fill
@@ -36,6 +36,23 @@ def test_roi_detector_initialization():
     assert detector.max_area == 50000
     assert detector.aspect_ratio_range == (0.2, 3.0)
 
+def test_roi_detector_thread_count(monkeypatch):
+    """Test that num_threads applies only while detect_displays runs."""
+    original_threads = cv2.getNumThreads()
+    detector = ROIDetector(num_threads=original_threads + 1)
+    assert cv2.getNumThreads() == original_threads
+    
+    seen = []
+    adaptive_threshold = cv2.adaptiveThreshold
+    def recording_threshold(*args):
+        seen.append(cv2.getNumThreads())
+        return adaptive_threshold(*args)
+    monkeypatch.setattr(cv2, 'adaptiveThreshold', recording_threshold)
+    
+    detector.detect_displays(create_test_image())
+    assert seen == [original_threads + 1]
+    assert cv2.getNumThreads() == original_threads
+
 def test_display_detection():
     """Test basic display detection functionality."""
     detector = ROIDetector()
@@ -69,6 +86,34 @@ def test_lcd_detection():
     for region in lcd_regions:
         assert region.confidence > 50  # LCD regions should have high confidence
 
+def test_large_image_detection():
+    """Test that regions found on a downscaled large frame map back to full resolution."""
+    detector = ROIDetector(max_area=5000000)
+    test_img = cv2.resize(create_test_image(), None, fx=4, fy=4)
+    
+    regions = detector.detect_displays(test_img)
+    
+    assert len(regions) >= 2
+    for region in regions:
+        assert region.x + region.width <= test_img.shape[1]
+        assert region.y + region.height <= test_img.shape[0]
+    
+    # The secondary display spans (450, 100)-(700, 200) in the original frame
+    assert any(
+        abs(r.x - 1800) <= 16 and abs(r.y - 400) <= 16 and abs(r.width - 1000) <= 32
+        for r in regions
+    )
+
+def test_grayscale_input():
+    """Test that a grayscale frame gives the same regions as its BGR original."""
+    detector = ROIDetector()
+    test_img = create_test_image()
+    gray = cv2.cvtColor(test_img, cv2.COLOR_BGR2GRAY)
+    
+    expected = detector.detect_displays(test_img)
+    assert detector.detect_displays(gray) == expected
+    assert detector.detect_displays(gray[:, :, np.newaxis]) == expected
+
 def test_region_visualization():
     """Test region visualization functionality."""
     detector = ROIDetector()
@@ -84,6 +129,11 @@ def test_region_visualization():
     
     # Check that visualization is different from original
     assert not np.array_equal(visualized, test_img)
+    
+    # A preview is drawn on a downscaled copy
+    preview = detector.draw_regions(test_img, regions, max_size=400)
+    assert preview.shape == (300, 400, 3)
+    assert not np.array_equal(preview, cv2.pyrDown(test_img))
 
 def test_confidence_calculation():
     """Test confidence score calculation."""
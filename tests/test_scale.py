@@ -1,5 +1,5 @@
 import pytest
-from src.processing.pattern_matcher import PatternMatcher, ReadingType
+from src.processing.pattern_matcher import PatternMatcher, ReadingType, ReadingsBatch
 
 @pytest.fixture
 def pattern_matcher():
@@ -56,4 +56,15 @@ def test_weight_multiple_readings(pattern_matcher):
     readings = pattern_matcher.extract_weight(text, 95.0)
     assert len(readings) == 2
     units = {r.unit for r in readings}
-    assert "lbs" in units and "kg" in units 
\ No newline at end of file
+    assert "lbs" in units and "kg" in units
+
+def test_extract_weight_as_batch(pattern_matcher):
+    text = "150lb 600lb 70kg"
+    readings = pattern_matcher.extract_weight(text, 95.0)
+    batch = pattern_matcher.extract_weight(text, 95.0, as_batch=True)
+    assert isinstance(batch, ReadingsBatch)
+    assert batch.values.tolist() == [r.value for r in readings]
+    assert batch.units == [r.unit for r in readings]
+    assert batch.is_valid.tolist() == [True, False, True]
+    assert batch.to_readings() == readings
+    assert len(pattern_matcher.extract_weight("no weight here", 95.0, as_batch=True)) == 0
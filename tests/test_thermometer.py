@@ -1,43 +1,40 @@
 import pytest
 from src.processing.pattern_matcher import PatternMatcher, ReadingType, MedicalReading
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pattern_matcher():
     return PatternMatcher()
 
-def test_valid_temperature_formats(pattern_matcher):
+@pytest.mark.parametrize("text,confidence", [
+    ("98.6F", 95.0),
+    ("98.6°F", 95.0),
+    ("37.0C", 95.0),
+    ("37.0°C", 95.0),
+    ("102.4F", 95.0),
+    ("39.1C", 95.0),
+])
+def test_valid_temperature_formats(pattern_matcher, text, confidence):
     """Test various valid temperature formats."""
-    valid_cases = [
-        ("98.6F", 95.0),
-        ("98.6°F", 95.0),
-        ("37.0C", 95.0),
-        ("37.0°C", 95.0),
-        ("102.4F", 95.0),
-        ("39.1C", 95.0),
-    ]
-    
-    for text, confidence in valid_cases:
-        validation = pattern_matcher.validate_temperature_format(text)
-        assert validation.is_valid, f"Failed to validate {text}"
-        assert validation.confidence_adjustment == 0.0
-        assert validation.error_reason is None
-        assert validation.suggested_correction is None
+    validation = pattern_matcher.validate_temperature_format(text)
+    assert validation.is_valid, f"Failed to validate {text}"
+    assert validation.confidence_adjustment == 0.0
+    assert validation.error_reason is None
+    assert validation.suggested_correction is None
 
-def test_invalid_temperature_formats(pattern_matcher):
+@pytest.mark.parametrize("text,expected_adjustment,expected_reason,expected_correction", [
+    ("56./", -20.0, "Invalid character '/' or '\\' in temperature", "56.."),
+    ("98.6", -25.0, "Missing temperature unit (F or C)", "98.6°F"),
+    ("98.6.", -15.0, "Temperature ends with decimal point", "98.6"),
+    ("abc", -30.0, "Invalid temperature format", None),
+])
+def test_invalid_temperature_formats(pattern_matcher, text, expected_adjustment,
+                                     expected_reason, expected_correction):
     """Test various invalid temperature formats."""
-    invalid_cases = [
-        ("56./", -20.0, "Invalid character '/' or '\\' in temperature", "56.."),
-        ("98.6", -25.0, "Missing temperature unit (F or C)", "98.6°F"),
-        ("98.6.", -15.0, "Temperature ends with decimal point", "98.6"),
-        ("abc", -30.0, "Invalid temperature format", None),
-    ]
-    
-    for text, expected_adjustment, expected_reason, expected_correction in invalid_cases:
-        validation = pattern_matcher.validate_temperature_format(text)
-        assert not validation.is_valid, f"Should not validate {text}"
-        assert validation.confidence_adjustment == expected_adjustment
-        assert validation.error_reason == expected_reason
-        assert validation.suggested_correction == expected_correction
+    validation = pattern_matcher.validate_temperature_format(text)
+    assert not validation.is_valid, f"Should not validate {text}"
+    assert validation.confidence_adjustment == expected_adjustment
+    assert validation.error_reason == expected_reason
+    assert validation.suggested_correction == expected_correction
 
 def test_temperature_confidence_threshold(pattern_matcher):
     """Test that readings below confidence threshold are rejected."""
@@ -56,33 +53,21 @@ def test_temperature_confidence_threshold(pattern_matcher):
     assert len(readings) == 1, "Should accept valid reading above threshold"
     assert readings[0].confidence >= pattern_matcher.TEMP_MIN_CONFIDENCE
 
-def test_temperature_range_validation(pattern_matcher):
+@pytest.mark.parametrize("text,confidence,expected_valid", [
+    ("98.6F", 95.0, True),
+    ("102.4F", 95.0, True),
+    ("37.0C", 95.0, True),
+    ("39.1C", 95.0, True),
+    ("94.0F", 95.0, False),  # Too low
+    ("106.0F", 95.0, False),  # Too high
+    ("34.0C", 95.0, False),  # Too low
+    ("42.0C", 95.0, False),  # Too high
+])
+def test_temperature_range_validation(pattern_matcher, text, confidence, expected_valid):
     """Test temperature range validation."""
-    # Test valid temperatures
-    valid_cases = [
-        ("98.6F", 95.0),
-        ("102.4F", 95.0),
-        ("37.0C", 95.0),
-        ("39.1C", 95.0),
-    ]
-    
-    for text, confidence in valid_cases:
-        readings = pattern_matcher.find_readings(text, confidence)
-        assert len(readings) == 1, f"Should accept {text}"
-        assert readings[0].is_valid, f"Should validate {text}"
-    
-    # Test invalid temperatures
-    invalid_cases = [
-        ("94.0F", 95.0),  # Too low
-        ("106.0F", 95.0),  # Too high
-        ("34.0C", 95.0),  # Too low
-        ("42.0C", 95.0),  # Too high
-    ]
-    
-    for text, confidence in invalid_cases:
-        readings = pattern_matcher.find_readings(text, confidence)
-        assert len(readings) == 1, f"Should detect {text}"
-        assert not readings[0].is_valid, f"Should reject {text}"
+    readings = pattern_matcher.find_readings(text, confidence)
+    assert len(readings) == 1, f"Should detect {text}"
+    assert readings[0].is_valid == expected_valid, f"Unexpected validity for {text}"
 
 def test_temperature_validation_details(pattern_matcher):
     """Test that validation details are properly included in readings."""
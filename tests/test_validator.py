@@ -1,9 +1,43 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
 import pytest
+from src.processing.word_data import WordData
 from src.processing.validator import Validator, ValidationIssue
 
-def test_validate_digits_with_confidence():
-    validator = Validator()
+def test_validate_digits_with_confidence(validator):
     word_data = [{"text": "835", "conf": "95.00"}]
     text, issues = validator.validate_digits_with_confidence(word_data, "835")
     assert len(issues) == 0
-    assert text == "835"
\ No newline at end of file
+    assert text == "835"
+
+def test_word_arrays_match_word_dicts(validator):
+    word_data = [
+        {"text": "835", "conf": "95.00"},
+        {"text": "35.5", "conf": "60.0"},
+        {"text": "Hot", "conf": "40"},
+        {"text": "120", "conf": "70"},
+    ]
+    word_arrays = WordData(
+        text=[w["text"] for w in word_data],
+        conf=np.array([float(w["conf"]) for w in word_data]),
+        left=np.zeros(4, dtype=np.int32),
+        top=np.zeros(4, dtype=np.int32),
+        width=np.zeros(4, dtype=np.int32),
+        height=np.zeros(4, dtype=np.int32),
+    )
+    for context in (None, "temperature_fahrenheit"):
+        expected = validator.validate_digits_with_confidence(word_data, "t", context)
+        assert validator.validate_digits_with_confidence(word_arrays, "t", context) == expected
+    assert validator.validate_digits_with_confidence(WordData.empty(), "t") == ("t", [])
+
+def test_validator_import_skips_ocr_dependencies():
+    """Importing the validator must not pull in pytesseract or PIL via ocr_engine."""
+    code = ("import sys, src.processing.validator; "
+            "print(sorted(m for m in ('pytesseract', 'PIL') if m in sys.modules))")
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, "-c", code], cwd=repo_root,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"